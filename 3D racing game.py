@@ -4,6 +4,14 @@
 Extended from the original template with complete racing game mechanics
 """
 
+# PyOpenGL flags must be set before the GL modules are imported.
+# Skip the glGetError check and call logging PyOpenGL does after every GL call
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+# Use the Cython argument converters from PyOpenGL-accelerate when it is installed
+OpenGL.USE_ACCELERATE = True
+
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
@@ -12,19 +20,41 @@ import random
 import time
 import sys
 
+DEBUG_MENU = False  # Set to True to print menu key presses
+
+# Menu and settings lookup tables, so input handling is a single index instead of if/elif chains
+MAIN_MENU_ITEMS = 5  # Play, Settings, Instructions, High Scores, Exit
+VEHICLE_NEXT = {"car": "bike", "bike": "cycle", "cycle": "car"}  # Settings page, UP arrow
+VEHICLE_PREV = {"car": "cycle", "cycle": "bike", "bike": "car"}  # Settings page, DOWN arrow
+WEATHER_NEXT = {"clear": "rain", "rain": "heavy_rain", "heavy_rain": "clear"}  # R key
+
 # Window constants
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 800
 
+# Track map layout (window pixel coordinates)
+MAP_X = WINDOW_WIDTH - 200
+MAP_Y = WINDOW_HEIGHT - 200
+MAP_WIDTH = 60
+MAP_HEIGHT = 180
+
+# Column-major glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1), used for all 2D overlays
+ORTHO_2D_MATRIX = (2.0 / WINDOW_WIDTH, 0.0, 0.0, 0.0,
+                   0.0, 2.0 / WINDOW_HEIGHT, 0.0, 0.0,
+                   0.0, 0.0, -1.0, 0.0,
+                   -1.0, -1.0, 0.0, 1.0)
+
 # Camera variables - Multiple Camera Modes System
 camera_pos = [0, 6, 8]
 camera_look = [0, 0, 0]
 fovY = 75
+FAR_PLANE = 2000  # Far clipping plane of the perspective projection
 camera_angle = 0
 
 # Camera modes system
 camera_mode = 0  # 0=Chase, 1=Drone, 2=Cinematic, 3=Free
 camera_modes = ["Chase", "Drone", "Cinematic", "Free"]
+NEXT_CAMERA_MODE = (1, 2, 3, 0)  # Camera mode reached by pressing C from each mode
 camera_follow_vehicle = True  # Only for Free mode
 camera_smooth_factor = 0.15   # Smooth camera transitions
 
@@ -41,11 +71,23 @@ camera_settings = {
     "Free": {"distance": 10, "height": 5, "smooth": 0.20}
 }
 
+# Scenery culling - objects outside this view-space box are skipped before any GL calls
+CULL_DISTANCE = FAR_PLANE  # Scenery is only dropped once it is past the far clipping plane
+CULL_BEHIND = 20     # Scenery further than this behind the camera can never be seen
+CULL_X = 40          # Extra sideways margin on top of the horizontal field of view
+CULL_SLOPE = math.tan(math.radians(fovY / 2)) * WINDOW_WIDTH / WINDOW_HEIGHT  # Frustum widening per unit ahead
+cull_eye_x = 0.0
+cull_eye_z = 0.0
+cull_dir_x = 0.0  # Camera heading on the ground plane (unit vector)
+cull_dir_z = 1.0
+
 # Road configuration
 ROAD_WIDTH = 20
 ROAD_LENGTH = 2000  # Total road length (fixed) - increased from 500
 ROAD_START = -1000  # Road starts here - extended from -250
 ROAD_END = 1000     # Road ends here - extended from 250
+ROAD_LEFT_EDGE = -ROAD_WIDTH / 2
+ROAD_RIGHT_EDGE = ROAD_WIDTH / 2
 road_segments = []
 
 # Environment variables
@@ -53,20 +95,122 @@ trees = []
 buildings = []
 street_lights = []
 clouds = []
+stars = []
 
 # Weather and time
 time_of_day = 0.5  # 0=midnight, 0.25=dawn, 0.5=noon, 0.75=dusk, 1=midnight
 weather_mode = "clear"  # clear, rain, heavy_rain
 rain_particles = []
 max_rain_particles = 800
+active_rain_particles = 0  # The first this-many rain_particles are falling, the rest are idle
+rain_vertex_array = (GLfloat * (6 * max_rain_particles))()  # Both line endpoints of every drop, refilled each frame
 rain_intensity = 0.0
 auto_time = True
 time_speed = 0.0001
 
+# Time phases returned by get_time_phase()
+NIGHT = 0
+DAWN = 1
+DAY = 2
+DUSK = 3
+TIME_PHASE_NAMES = ("Night", "Dawn", "Day", "Dusk")
+# Values derived from time_of_day, refreshed once per frame by update_time_state()
+time_phase = DAY
+sun_cos = -1.0  # cos/sin of the sun's angle around the sky (time_of_day * 2 * pi)
+sun_sin = 0.0
+
+# Sky palette for each time phase, indexed by NIGHT/DAWN/DAY/DUSK
+SKY_COLORS = (
+    {  # NIGHT
+        'top': (0.0, 0.0, 0.2),
+        'bottom': (0.1, 0.1, 0.3),
+        'sun': (0.9, 0.9, 1.0),
+        'ambient': 0.15
+    },
+    {  # DAWN
+        'top': (0.4, 0.3, 0.6),
+        'bottom': (1.0, 0.6, 0.4),
+        'sun': (1.0, 0.8, 0.6),
+        'ambient': 0.4
+    },
+    {  # DAY
+        'top': (0.4, 0.6, 1.0),
+        'bottom': (0.7, 0.85, 1.0),
+        'sun': (1.0, 1.0, 0.8),
+        'ambient': 0.8
+    },
+    {  # DUSK
+        'top': (0.3, 0.2, 0.5),
+        'bottom': (0.8, 0.5, 0.3),
+        'sun': (1.0, 0.7, 0.5),
+        'ambient': 0.5
+    }
+)
+
+# Lighting, fog and cloud colors; the light and fog ones are GLfloat arrays so glLightfv/glFogfv don't convert a list every frame
+environment_color_cache = {}  # (time phase, weather) -> (clear color, sky color, light0 diffuse, light0 ambient, light1 diffuse)
+applied_light_colors = None  # cache entry whose light colors are currently loaded into GL_LIGHT0/GL_LIGHT1
+sun_position = (GLfloat * 4)(0, 0, -100, 0)  # x and y follow time_of_day
+FILL_LIGHT_POSITION = (GLfloat * 4)(-50, 30, 50, 0)
+CLOUD_COLORS = {  # weather -> cloud RGBA
+    "clear": (1.0, 1.0, 1.0, 0.5),
+    "rain": (0.5, 0.5, 0.6, 0.8),
+    "heavy_rain": (0.3, 0.3, 0.4, 0.9)
+}
+FOG_SETTINGS = {  # weather -> (fog color, fog density)
+    "clear": ((GLfloat * 4)(0.7, 0.7, 0.8, 1.0), 0.008),
+    "rain": ((GLfloat * 4)(0.6, 0.6, 0.7, 1.0), 0.015),
+    "heavy_rain": ((GLfloat * 4)(0.5, 0.5, 0.6, 1.0), 0.025)
+}
+
 # Visual effects
 use_fog = False
 use_lighting = True
 
+# Display lists for static geometry (compiled once by init_display_lists)
+PALM_TRUNK_DL = 0
+PALM_LEAVES_DL = 0
+ROAD_MAP_DL = 0
+SHIELD_DL = 0
+CAR_DL = 0
+BIKE_DL = 0
+MOTORCYCLE_DL = 0
+MOTORCYCLE_LOD_DL = 0  # Bicycle without the chainring teeth, for distant cameras
+CHAINRING_LOD_DISTANCE = 15.0  # Beyond this camera distance the teeth are smaller than a pixel
+SPEED_POWERUP_DL = 0
+SHIELD_POWERUP_DL = 0
+POWERUP_GLOW_DL = 0
+GAME_CONTROLS_DL = 0
+ENVIRONMENT_CONTROLS_DL = 0
+INSTRUCTIONS_PAGE_DL = 0
+ROAD_MARKINGS_DL = 0
+WARNING_STRIPES_DL = 0
+GROUND_DL = 0
+SKY_BOX_DL = 0
+STARS_DL = 0
+SUN_DL = 0
+SUN_GLOW_DL = 0
+MOON_DL = 0
+MOON_GLOW_DL = 0
+SPAWN_BOUNDARY_LINES_DL = 0
+ROAD_SIDE_LINES_DL = 0
+ROAD_EDGE_MARKERS_DL = 0
+BOUNDARY_WALLS_DL = 0
+BOUNDARY_MARKERS_DL = 0
+OBSTACLE_BOX_DL = 0
+OBSTACLE_CYLINDER_DL = 0
+HIGH_SCORES_PAGE_DL = 0  # Built on demand by get_high_scores_page_list
+high_scores_page_scores = []  # Scores HIGH_SCORES_PAGE_DL was compiled from
+
+# Bitmap fonts compiled into 256 display lists each (base id of the first list)
+HELVETICA_10_FONT = 0
+HELVETICA_12_FONT = 0
+HELVETICA_18_FONT = 0
+TIMES_ROMAN_24_FONT = 0
+
+# Encoded HUD strings from the last frame, keyed by their format template
+hud_text_cache = {}
+
 # ===== NEW RACING GAME FEATURES =====
 
 # Game state
@@ -194,7 +338,7 @@ class Vehicle:
         self.suspension_offset = 0.0  # Bounce effect
         self.tilt_angle = 0.0  # Banking in turns
     
-    def update(self, keys_pressed):
+    def update(self, keys_pressed, special_keys_pressed):
         """Update vehicle position and physics with realistic momentum and braking"""
         if game_state != "playing":
             return
@@ -205,17 +349,17 @@ class Vehicle:
         steering_input = 0.0
         
         # Throttle (forward) - W key or Up arrow
-        if keys_pressed.get(b'w') or keys_pressed.get(b'W') or keys_pressed.get(GLUT_KEY_UP):
+        if keys_pressed[KEY_W] or keys_pressed[KEY_UPPER_W] or special_keys_pressed[GLUT_KEY_UP]:
             throttle_input = 1.0
         
         # Brake (slow down) - S key or Down arrow (NOT reverse)
-        if keys_pressed.get(b's') or keys_pressed.get(b'S') or keys_pressed.get(GLUT_KEY_DOWN):
+        if keys_pressed[KEY_S] or keys_pressed[KEY_UPPER_S] or special_keys_pressed[GLUT_KEY_DOWN]:
             brake_input = 1.0
         
         # Steering (left/right)
-        if keys_pressed.get(b'a') or keys_pressed.get(b'A') or keys_pressed.get(GLUT_KEY_LEFT):
+        if keys_pressed[KEY_A] or keys_pressed[KEY_UPPER_A] or special_keys_pressed[GLUT_KEY_LEFT]:
             steering_input = 1.0
-        elif keys_pressed.get(b'd') or keys_pressed.get(b'D') or keys_pressed.get(GLUT_KEY_RIGHT):
+        elif keys_pressed[KEY_D] or keys_pressed[KEY_UPPER_D] or special_keys_pressed[GLUT_KEY_RIGHT]:
             steering_input = -1.0
         
         # Realistic acceleration with momentum system
@@ -453,8 +597,8 @@ class Vehicle:
                 pass  # Don't reset position during reverse turning maneuvers
         
         # Check road boundaries - STRICT BOUNDARY ENFORCEMENT
-        road_left_edge = -ROAD_WIDTH / 2
-        road_right_edge = ROAD_WIDTH / 2
+        road_left_edge = ROAD_LEFT_EDGE
+        road_right_edge = ROAD_RIGHT_EDGE
         road_start_edge = ROAD_START  # Allow backward movement to start line
         
         # Prevent car from going beyond road boundaries - IMMEDIATE CORRECTION
@@ -572,7 +716,13 @@ class Vehicle:
 
 # Game objects
 player_vehicle = Vehicle("car")
-keys_pressed = {}
+# Held keys, indexed by key code (1 = down) so polling them each frame is a plain array read
+keys_pressed = bytearray(256)          # ASCII keys from keyboard()
+special_keys_pressed = bytearray(256)  # GLUT_KEY_* codes from special_keys()
+KEY_W, KEY_UPPER_W = ord('w'), ord('W')
+KEY_S, KEY_UPPER_S = ord('s'), ord('S')
+KEY_A, KEY_UPPER_A = ord('a'), ord('A')
+KEY_D, KEY_UPPER_D = ord('d'), ord('D')
 
 # Obstacles
 class Obstacle:
@@ -617,8 +767,8 @@ class Powerup:
         self.collected = False
         self.size = 1.0
     
-    def update(self):
-        """Update powerup animation with hovering effects"""
+    def update(self, hover_offset, sway_offset):
+        """Update powerup animation with hovering effects (offsets are shared by all powerups)"""
         if self.collected:
             return
         
@@ -626,7 +776,7 @@ class Powerup:
         
         # Enhanced hovering animation
         # Vertical floating motion
-        self.y = 1.0 + math.sin(time.time() * 3.0) * 0.3
+        self.y = 1.0 + hover_offset
         
         # Pulsing scale effect
         self.scale += 0.02 * self.scale_direction
@@ -636,7 +786,7 @@ class Powerup:
             self.scale_direction = 1
         
         # Add slight horizontal sway
-        self.x += math.sin(time.time() * 2.0) * 0.01
+        self.x += sway_offset
     
     def get_aabb(self):
         """Get powerup's AABB for collision detection"""
@@ -762,6 +912,7 @@ def init_scene():
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     
     # Set initial clear color
+    update_time_state()
     update_clear_color()
     glClearDepth(1.0)
     
@@ -770,9 +921,127 @@ def init_scene():
     init_environment()
     init_rain_system()
     
+    # Compile static geometry once the GL context exists
+    init_display_lists()
+    
     # Setup initial lighting
+    init_lighting()
     setup_lighting()
 
+def compile_display_list(draw_function):
+    """Record the GL calls made by draw_function into a new display list and return its id"""
+    list_id = glGenLists(1)
+    glNewList(list_id, GL_COMPILE)
+    draw_function()
+    glEndList()
+    return list_id
+
+def compile_font(font):
+    """Compile one display list per character code of a GLUT bitmap font and return the base id"""
+    base = glGenLists(256)
+    for char_code in range(256):
+        glNewList(base + char_code, GL_COMPILE)
+        glutBitmapCharacter(font, char_code)
+        glEndList()
+    return base
+
+def draw_text(x, y, text, font_base):
+    """Draw a string (or already encoded bytes) at a raster position with a single glCallLists call"""
+    if isinstance(text, str):
+        # GLUT bitmap fonts only have latin-1 glyphs, other characters were never drawn
+        text = text.encode('latin-1', 'ignore')
+    glRasterPos2f(x, y)
+    glListBase(font_base)
+    glCallLists(text)
+
+def get_hud_text(template, *values):
+    """Format a HUD string, reusing the encoded text from earlier frames while its values are unchanged"""
+    cached = hud_text_cache.get(template)
+    if cached is None or cached[0] != values:
+        cached = (values, template.format(*values).encode('latin-1', 'ignore'))
+        hud_text_cache[template] = cached
+    return cached[1]
+
+def init_display_lists():
+    """Compile static geometry into display lists so it is replayed with a single call"""
+    global PALM_TRUNK_DL, PALM_LEAVES_DL, ROAD_MAP_DL, SHIELD_DL, ROAD_MARKINGS_DL, WARNING_STRIPES_DL
+    global GROUND_DL, SKY_BOX_DL, STARS_DL, SPAWN_BOUNDARY_LINES_DL, ROAD_SIDE_LINES_DL, ROAD_EDGE_MARKERS_DL
+    global SUN_DL, SUN_GLOW_DL, MOON_DL, MOON_GLOW_DL
+    global BOUNDARY_WALLS_DL, BOUNDARY_MARKERS_DL
+    global CAR_DL, BIKE_DL, MOTORCYCLE_DL, MOTORCYCLE_LOD_DL
+    global SPEED_POWERUP_DL, SHIELD_POWERUP_DL, POWERUP_GLOW_DL
+    global OBSTACLE_BOX_DL, OBSTACLE_CYLINDER_DL
+    global HELVETICA_10_FONT, HELVETICA_12_FONT, HELVETICA_18_FONT, TIMES_ROMAN_24_FONT
+    global GAME_CONTROLS_DL, ENVIRONMENT_CONTROLS_DL, INSTRUCTIONS_PAGE_DL
+    
+    PALM_TRUNK_DL = compile_display_list(draw_palm_trunk)
+    PALM_LEAVES_DL = compile_display_list(draw_palm_leaves)
+    
+    # Trees never move; each one is compiled at its own size and position (palms reuse the lists above)
+    for tree in trees:
+        tree['list'] = compile_display_list(lambda: draw_tree_model(tree))
+    
+    GROUND_DL = compile_display_list(draw_ground)
+    SKY_BOX_DL = compile_display_list(draw_sky_box)
+    STARS_DL = compile_display_list(draw_stars)
+    
+    # Sun and moon spheres with their glows (colors are set by draw_sky)
+    SUN_DL = compile_display_list(lambda: glutSolidSphere(8, 20, 20))
+    SUN_GLOW_DL = compile_display_list(lambda: glutSolidSphere(15, 16, 16))
+    MOON_DL = compile_display_list(lambda: glutSolidSphere(5, 16, 16))
+    MOON_GLOW_DL = compile_display_list(lambda: glutSolidSphere(10, 12, 12))
+    
+    ROAD_MAP_DL = compile_display_list(draw_road_map_background)
+    ROAD_MARKINGS_DL = compile_display_list(draw_road_markings)
+    WARNING_STRIPES_DL = compile_display_list(draw_warning_stripes)
+    SPAWN_BOUNDARY_LINES_DL = compile_display_list(draw_spawn_boundary_lines)
+    ROAD_SIDE_LINES_DL = compile_display_list(draw_road_side_lines)
+    ROAD_EDGE_MARKERS_DL = compile_display_list(draw_road_edge_markers)
+    BOUNDARY_WALLS_DL = compile_display_list(draw_boundary_walls)
+    BOUNDARY_MARKERS_DL = compile_display_list(draw_boundary_markers)
+    SHIELD_DL = compile_display_list(lambda: glutWireSphere(1.8, 8, 8))  # Much smaller and less detailed
+    
+    # Vehicle models are static in their local space
+    CAR_DL = compile_display_list(draw_car_model)
+    BIKE_DL = compile_display_list(draw_bike_model)
+    MOTORCYCLE_DL = compile_display_list(draw_motorcycle_model)
+    MOTORCYCLE_LOD_DL = compile_display_list(lambda: draw_motorcycle_model(chainring_teeth=False))
+    
+    # Buildings never move, so each one keeps its own lists for the walls and the lit windows
+    for building in buildings:
+        building['body_list'] = compile_display_list(lambda: draw_building_body(building))
+        building['windows_list'] = compile_display_list(lambda: draw_building_windows(building))
+    
+    # Clouds drift, so only their shape is compiled; the position is applied when drawing
+    for cloud in clouds:
+        cloud['list'] = compile_display_list(lambda: draw_cloud_model(cloud))
+    
+    # Street lights never move either; the lamp has a lit and an unlit version
+    for light in street_lights:
+        light['pole_list'] = compile_display_list(lambda: draw_street_light_pole(light))
+        light['lit_list'] = compile_display_list(lambda: draw_street_light_fixture(light, True))
+        light['unlit_list'] = compile_display_list(lambda: draw_street_light_fixture(light, False))
+    
+    # Obstacle shapes at unit size, scaled per obstacle when drawn
+    OBSTACLE_BOX_DL = compile_display_list(lambda: glutSolidCube(1))
+    OBSTACLE_CYLINDER_DL = compile_display_list(lambda: glutSolidCylinder(1, 1, 8, 8))
+    
+    # Powerup icons (animated with per-instance transforms only)
+    SPEED_POWERUP_DL = compile_display_list(draw_speed_powerup)
+    SHIELD_POWERUP_DL = compile_display_list(draw_shield_powerup)
+    POWERUP_GLOW_DL = compile_display_list(lambda: glutSolidSphere(0.8, 8, 8))
+    
+    # HUD and menu text fonts
+    HELVETICA_10_FONT = compile_font(GLUT_BITMAP_HELVETICA_10)
+    HELVETICA_12_FONT = compile_font(GLUT_BITMAP_HELVETICA_12)
+    HELVETICA_18_FONT = compile_font(GLUT_BITMAP_HELVETICA_18)
+    TIMES_ROMAN_24_FONT = compile_font(GLUT_BITMAP_TIMES_ROMAN_24)
+    
+    # Static HUD panels and menu pages (after the fonts, since their text calls the font lists)
+    GAME_CONTROLS_DL = compile_display_list(draw_game_controls_panel)
+    ENVIRONMENT_CONTROLS_DL = compile_display_list(draw_environment_controls_panel)
+    INSTRUCTIONS_PAGE_DL = compile_display_list(draw_instructions_page)
+
 def init_road_layout():
     """Initialize fixed-length straight road segments"""
     global road_segments
@@ -792,7 +1061,7 @@ def init_road_layout():
 
 def init_environment():
     """Initialize all environment objects positioned beside the fixed road"""
-    global trees, buildings, street_lights, clouds
+    global trees, buildings, street_lights, clouds, stars
     
     # Generate street lights BESIDE the road along its length
     street_lights = []
@@ -820,6 +1089,10 @@ def init_environment():
     street_lights.append({'x': -(ROAD_WIDTH/2 + 5), 'z': ROAD_END, 'side': 'left', 'special': 'finish'})
     street_lights.append({'x': (ROAD_WIDTH/2 + 5), 'z': ROAD_END, 'side': 'right', 'special': 'finish'})
     
+    # Arm and glow reach ~6 units from the pole
+    for light in street_lights:
+        light['cull_radius'] = 6.0
+    
     # Generate buildings BESIDE the road
     buildings = []
     building_spacing = 80
@@ -845,6 +1118,15 @@ def init_environment():
                 'depth': random.uniform(15, 20)
             })
     
+    # Pick which windows are lit once so they don't flicker from frame to frame
+    for building in buildings:
+        building['cull_radius'] = max(building['width'], building['depth'])
+        building['lit_windows'] = []
+        for floor in range(3, int(building['height']), 5):
+            for window_x in range(-int(building['width']/2) + 2, int(building['width']/2) - 1, 3):
+                if random.random() > 0.2:
+                    building['lit_windows'].append((window_x, floor - building['height']/2))
+    
     # Generate trees along the road
     trees = []
     tree_spacing = 25
@@ -876,6 +1158,10 @@ def init_environment():
                 'type': random.choice(['pine', 'oak', 'palm'])
             })
     
+    # Crowns spread up to about half the tree height
+    for tree in trees:
+        tree['cull_radius'] = tree['height']
+    
     # Generate clouds
     clouds = []
     for i in range(15):
@@ -883,8 +1169,21 @@ def init_environment():
             'x': random.uniform(-200, 200),
             'y': random.uniform(60, 100),
             'z': random.uniform(ROAD_START - 100, ROAD_END + 100),
-            'size': random.uniform(15, 30)
+            'size': random.uniform(15, 30),
+            'jitter': [random.uniform(-2, 2) for j in range(4)]  # Height offset of each puff
         })
+    
+    # Puffs spread size/2 either side of the centre, each with radius size/2
+    for cloud in clouds:
+        cloud['cull_radius'] = cloud['size']
+    
+    # Generate stars with a fixed seed for consistent star positions
+    star_random = random.Random(42)
+    stars = []
+    for i in range(100):
+        stars.append((star_random.uniform(-450, 450),
+                      star_random.uniform(100, 280),
+                      star_random.uniform(-450, 1400)))
 
 def init_rain_system():
     """Initialize rain particle system"""
@@ -895,68 +1194,78 @@ def init_rain_system():
             'x': random.uniform(-150, 150),
             'y': random.uniform(0, 100),
             'z': random.uniform(ROAD_START - 50, ROAD_END + 50),
-            'speed': random.uniform(1.5, 3.0),
-            'active': False
+            'speed': random.uniform(1.5, 3.0)
         })
 
 def get_time_phase():
-    """Get current time phase"""
+    """Get current time phase (NIGHT, DAWN, DAY or DUSK)"""
     if 0.0 <= time_of_day < 0.2:
-        return "Night"
+        return NIGHT
     elif 0.2 <= time_of_day < 0.35:
-        return "Dawn"
+        return DAWN
     elif 0.35 <= time_of_day < 0.65:
-        return "Day"
+        return DAY
     elif 0.65 <= time_of_day < 0.8:
-        return "Dusk"
+        return DUSK
     else:
-        return "Night"
+        return NIGHT
+
+def update_time_state():
+    """Refresh time_phase and the sun angle once per frame so draw code doesn't re-derive them from time_of_day"""
+    global time_phase, sun_cos, sun_sin
+    time_phase = get_time_phase()
+    
+    sun_angle = time_of_day * 2 * math.pi
+    sun_cos = math.cos(sun_angle)
+    sun_sin = math.sin(sun_angle)
 
 def get_sky_colors():
     """Get sky colors based on time of day"""
-    phase = get_time_phase()
-    
-    colors = {
-        "Night": {
-            'top': [0.0, 0.0, 0.2],
-            'bottom': [0.1, 0.1, 0.3],
-            'sun': [0.9, 0.9, 1.0],
-            'ambient': 0.15
-        },
-        "Dawn": {
-            'top': [0.4, 0.3, 0.6],
-            'bottom': [1.0, 0.6, 0.4],
-            'sun': [1.0, 0.8, 0.6],
-            'ambient': 0.4
-        },
-        "Day": {
-            'top': [0.4, 0.6, 1.0],
-            'bottom': [0.7, 0.85, 1.0],
-            'sun': [1.0, 1.0, 0.8],
-            'ambient': 0.8
-        },
-        "Dusk": {
-            'top': [0.3, 0.2, 0.5],
-            'bottom': [0.8, 0.5, 0.3],
-            'sun': [1.0, 0.7, 0.5],
-            'ambient': 0.5
-        }
-    }
-    
-    return colors.get(phase, colors["Day"])
+    return SKY_COLORS[time_phase]
 
-def update_clear_color():
-    """Update the clear color based on time of day"""
+def get_environment_colors():
+    """Get the clear, sky and light colors for the current time phase and weather, building them on first use"""
+    phase = time_phase
+    key = (phase, weather_mode)
+    colors = environment_color_cache.get(key)
+    if colors is not None:
+        return colors
+    
     sky_colors = get_sky_colors()
     
     # Apply weather effects
     if weather_mode == "heavy_rain":
-        clear_color = [c * 0.5 for c in sky_colors['bottom']]
+        clear_color = tuple(c * 0.5 for c in sky_colors['bottom'])
+        sky_color = tuple(c * 0.5 for c in sky_colors['top'])
+        weather_dimming = 0.4
     elif weather_mode == "rain":
-        clear_color = [c * 0.7 for c in sky_colors['bottom']]
+        clear_color = tuple(c * 0.7 for c in sky_colors['bottom'])
+        sky_color = tuple(c * 0.7 for c in sky_colors['top'])
+        weather_dimming = 0.6
     else:
-        clear_color = sky_colors['bottom']
+        clear_color = tuple(sky_colors['bottom'])
+        sky_color = tuple(sky_colors['top'])
+        weather_dimming = 1.0
     
+    # Main light
+    intensity = sky_colors['ambient'] * weather_dimming
+    if phase == NIGHT:
+        light0_diffuse = (GLfloat * 4)(0.3, 0.3, 0.4, 1.0)
+        light0_ambient = (GLfloat * 4)(0.1, 0.1, 0.15, 1.0)
+    else:
+        light0_diffuse = (GLfloat * 4)(intensity, intensity * 0.95, intensity * 0.9, 1.0)
+        light0_ambient = (GLfloat * 4)(intensity * 0.3, intensity * 0.3, intensity * 0.35, 1.0)
+    
+    # Fill light
+    light1_diffuse = (GLfloat * 4)(intensity * 0.3, intensity * 0.3, intensity * 0.3, 1.0)
+    
+    colors = (clear_color, sky_color, light0_diffuse, light0_ambient, light1_diffuse)
+    environment_color_cache[key] = colors
+    return colors
+
+def update_clear_color():
+    """Update the clear color based on time of day"""
+    clear_color = get_environment_colors()[0]
     glClearColor(clear_color[0], clear_color[1], clear_color[2], 1.0)
 
 def setup_camera():
@@ -966,7 +1275,7 @@ def setup_camera():
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     # Raised and moved back for better view of longer road
-    gluPerspective(fovY, WINDOW_WIDTH/WINDOW_HEIGHT, 0.1, 2000)  # Extended far plane to 2000
+    gluPerspective(fovY, WINDOW_WIDTH/WINDOW_HEIGHT, 0.1, FAR_PLANE)  # Extended far plane to 2000
     
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
@@ -1019,52 +1328,79 @@ def setup_camera():
         gluLookAt(current_camera_x, current_camera_y, current_camera_z,
                   player_vehicle.x, player_vehicle.y + 1, player_vehicle.z,
                   0, 1, 0)
+        update_view_cull(current_camera_x, current_camera_z, player_vehicle.x, player_vehicle.z)
     else:
         # Static camera for menu
         gluLookAt(camera_pos[0], camera_pos[1], camera_pos[2],
                   camera_look[0], camera_look[1], camera_look[2],
                   0, 1, 0)
-
-def setup_lighting():
-    """Setup dynamic lighting based on time of day"""
+        update_view_cull(camera_pos[0], camera_pos[2], camera_look[0], camera_look[2])
+
+def update_view_cull(eye_x, eye_z, target_x, target_z):
+    """Store the camera position and ground-plane heading used to cull scenery"""
+    global cull_eye_x, cull_eye_z, cull_dir_x, cull_dir_z
+    
+    cull_eye_x = eye_x
+    cull_eye_z = eye_z
+    
+    dir_x = target_x - eye_x
+    dir_z = target_z - eye_z
+    length = math.hypot(dir_x, dir_z)
+    if length > 0.001:
+        cull_dir_x = dir_x / length
+        cull_dir_z = dir_z / length
+
+def is_in_view(x, z, radius=0.0):
+    """Cheap visibility test for scenery - False if the object is behind, too far or beside the view"""
+    dx = x - cull_eye_x
+    dz = z - cull_eye_z
+    
+    # Distance along the viewing direction
+    forward = dx * cull_dir_x + dz * cull_dir_z
+    if forward < -CULL_BEHIND - radius or forward > CULL_DISTANCE + radius:
+        return False
+    
+    # Sideways distance, compared against the widening horizontal field of view
+    sideways = abs(dx * cull_dir_z - dz * cull_dir_x)
+    return sideways <= CULL_X + radius + max(forward, 0.0) * CULL_SLOPE
+
+def visible_scenery(objects):
+    """Return the scenery objects that pass the is_in_view test, using each object's precomputed 'cull_radius'"""
+    return [obj for obj in objects if is_in_view(obj['x'], obj['z'], obj['cull_radius'])]
+
+def init_lighting():
+    """Enable the lights and color material once; every draw that turns lighting off turns it back on"""
     glEnable(GL_LIGHTING)
     glEnable(GL_LIGHT0)  # Sun/Moon
     glEnable(GL_LIGHT1)  # Ambient fill
     glEnable(GL_COLOR_MATERIAL)
     glColorMaterial(GL_FRONT, GL_AMBIENT_AND_DIFFUSE)
-    
-    sky_colors = get_sky_colors()
-    phase = get_time_phase()
+
+def setup_lighting():
+    """Setup dynamic lighting based on time of day"""
+    global applied_light_colors
     
     # Sun/Moon position
-    sun_angle = time_of_day * 2 * math.pi
-    sun_x = math.cos(sun_angle) * 150
-    sun_y = math.sin(sun_angle) * 80 + 40
-    sun_z = -100
+    # Light positions are transformed by the current modelview, so they are re-sent after every camera setup
+    sun_position[0] = sun_cos * 150
+    sun_position[1] = sun_sin * 80 + 40
     
-    # Weather dimming
-    weather_dimming = 1.0
-    if weather_mode == "rain":
-        weather_dimming = 0.6
-    elif weather_mode == "heavy_rain":
-        weather_dimming = 0.4
+    glLightfv(GL_LIGHT0, GL_POSITION, sun_position)
+    glLightfv(GL_LIGHT1, GL_POSITION, FILL_LIGHT_POSITION)
     
-    # Main light
-    intensity = sky_colors['ambient'] * weather_dimming
-    if phase == "Night":
-        light0_diffuse = [0.3, 0.3, 0.4, 1.0]
-        light0_ambient = [0.1, 0.1, 0.15, 1.0]
-    else:
-        light0_diffuse = [intensity, intensity * 0.95, intensity * 0.9, 1.0]
-        light0_ambient = [intensity * 0.3, intensity * 0.3, intensity * 0.35, 1.0]
+    # Light colors only change with the time phase and weather, so they come ready-made from the cache
+    # and are only uploaded again when a different cache entry is picked
+    colors = get_environment_colors()
+    if colors is applied_light_colors:
+        return
+    applied_light_colors = colors
+    clear_color, sky_color, light0_diffuse, light0_ambient, light1_diffuse = colors
     
-    glLightfv(GL_LIGHT0, GL_POSITION, [sun_x, sun_y, sun_z, 0])
     glLightfv(GL_LIGHT0, GL_DIFFUSE, light0_diffuse)
     glLightfv(GL_LIGHT0, GL_AMBIENT, light0_ambient)
     
     # Fill light
-    glLightfv(GL_LIGHT1, GL_POSITION, [-50, 30, 50, 0])
-    glLightfv(GL_LIGHT1, GL_DIFFUSE, [intensity * 0.3, intensity * 0.3, intensity * 0.3, 1.0])
+    glLightfv(GL_LIGHT1, GL_DIFFUSE, light1_diffuse)
 
 def setup_fog():
     """Setup fog with weather integration"""
@@ -1073,16 +1409,8 @@ def setup_fog():
     if should_use_fog:
         glEnable(GL_FOG)
         
-        if weather_mode == "heavy_rain":
-            fog_color = [0.5, 0.5, 0.6, 1.0]
-            glFogf(GL_FOG_DENSITY, 0.025)
-        elif weather_mode == "rain":
-            fog_color = [0.6, 0.6, 0.7, 1.0]
-            glFogf(GL_FOG_DENSITY, 0.015)
-        else:
-            fog_color = [0.7, 0.7, 0.8, 1.0]
-            glFogf(GL_FOG_DENSITY, 0.008)
-        
+        fog_color, fog_density = FOG_SETTINGS[weather_mode]
+        glFogf(GL_FOG_DENSITY, fog_density)
         glFogfv(GL_FOG_COLOR, fog_color)
         glFogi(GL_FOG_MODE, GL_EXP)
     else:
@@ -1090,7 +1418,7 @@ def setup_fog():
 
 def update_rain_particles():
     """Update rain particle positions"""
-    global rain_intensity
+    global rain_intensity, active_rain_particles
     
     if weather_mode == "clear":
         rain_intensity = 0.0
@@ -1104,18 +1432,20 @@ def update_rain_particles():
     else:
         active_particles = 0
     
-    for i, particle in enumerate(rain_particles):
-        if i < active_particles:
-            particle['active'] = True
-            particle['y'] -= particle['speed']
-            particle['x'] += random.uniform(-0.1, 0.1)  # Wind
-            
-            if particle['y'] < 0:
-                particle['x'] = random.uniform(-150, 150)
-                particle['y'] = random.uniform(80, 100)
-                particle['z'] = random.uniform(ROAD_START - 50, ROAD_END + 50)
-        else:
-            particle['active'] = False
+    active_rain_particles = active_particles
+    
+    # Only the active particles are visited, so clear weather costs nothing per frame.
+    # random.random is bound locally and scaled by hand, which is much cheaper than random.uniform
+    rand = random.random
+    for particle in rain_particles[:active_particles]:
+        y = particle['y'] - particle['speed']
+        particle['x'] += (rand() - 0.5) * 0.2  # Wind
+        
+        if y < 0:
+            particle['x'] = rand() * 300 - 150
+            y = 80 + rand() * 20
+            particle['z'] = ROAD_START - 50 + rand() * (ROAD_LENGTH + 100)
+        particle['y'] = y
 
 def draw_rain():
     """Draw rain particles"""
@@ -1133,12 +1463,20 @@ def draw_rain():
         glColor4f(0.7, 0.7, 0.9, 0.6)
         glLineWidth(1.0)
     
-    glBegin(GL_LINES)
-    for particle in rain_particles:
-        if particle['active']:
-            glVertex3f(particle['x'], particle['y'], particle['z'])
-            glVertex3f(particle['x'] - 0.5, particle['y'] - 4, particle['z'] - 0.5)
-    glEnd()
+    # Gather the endpoints into one flat list and submit every drop with a single draw call
+    vertices = []
+    add_vertices = vertices.extend
+    for particle in rain_particles[:active_rain_particles]:
+        x = particle['x']
+        y = particle['y']
+        z = particle['z']
+        add_vertices((x, y, z, x - 0.5, y - 4, z - 0.5))
+    rain_vertex_array[:len(vertices)] = vertices
+    
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, rain_vertex_array)
+    glDrawArrays(GL_LINES, 0, active_rain_particles * 2)
+    glDisableClientState(GL_VERTEX_ARRAY)
     
     glDepthMask(GL_TRUE)
     glEnable(GL_LIGHTING)
@@ -1158,67 +1496,70 @@ def draw_road():
     
     # Debug: Draw spawn boundaries as colored lines
     if game_state == "playing":
-        # Obstacle spawn boundary (green line)
-        glColor3f(0.0, 1.0, 0.0)  # Green
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        for z in range(int(ROAD_START), int(ROAD_END), 10):
-            # Left boundary
-            glVertex3f(-ROAD_WIDTH/2 + 4.0, 0.02, z)
-            glVertex3f(-ROAD_WIDTH/2 + 4.0, 0.02, z + 5)
-            # Right boundary
-            glVertex3f(ROAD_WIDTH/2 - 4.0, 0.02, z)
-            glVertex3f(ROAD_WIDTH/2 - 4.0, 0.02, z + 5)
-        glEnd()
-        
-        # Powerup spawn boundary (blue line)
-        glColor3f(0.0, 0.0, 1.0)  # Blue
-        glBegin(GL_LINES)
-        for z in range(int(ROAD_START), int(ROAD_END), 10):
-            # Left boundary
-            glVertex3f(-ROAD_WIDTH/2 + 3.0, 0.02, z)
-            glVertex3f(-ROAD_WIDTH/2 + 3.0, 0.02, z + 5)
-            # Right boundary
-            glVertex3f(ROAD_WIDTH/2 - 3.0, 0.02, z)
-            glVertex3f(ROAD_WIDTH/2 - 3.0, 0.02, z + 5)
-        glEnd()
+        glCallList(SPAWN_BOUNDARY_LINES_DL)
     
-    # Draw start line (green)
-    glColor3f(0, 1, 0)
-    glBegin(GL_QUADS)
-    glVertex3f(-ROAD_WIDTH/2, 0.01, ROAD_START)
-    glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_START)
-    glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_START + 2)
-    glVertex3f(-ROAD_WIDTH/2, 0.01, ROAD_START + 2)
-    glEnd()
+    # Start line, checkered finish line and center lane markings
+    glCallList(ROAD_MARKINGS_DL)
     
-    # Draw finish line (checkered pattern)
-    checker_size = 2
-    for x in range(int(-ROAD_WIDTH/2), int(ROAD_WIDTH/2), checker_size):
-        for z in range(0, 4, checker_size):
-            if (int(x/checker_size) + int(z/checker_size)) % 2 == 0:
-                glColor3f(1, 1, 1)
-            else:
-                glColor3f(0, 0, 0)
-            glBegin(GL_QUADS)
-            glVertex3f(x, 0.01, ROAD_END - 4 + z)
-            glVertex3f(x + checker_size, 0.01, ROAD_END - 4 + z)
-            glVertex3f(x + checker_size, 0.01, ROAD_END - 4 + z + checker_size)
-            glVertex3f(x, 0.01, ROAD_END - 4 + z + checker_size)
-            glEnd()
+    # Side lines (continuous) - THICKER AND MORE VISIBLE
+    glCallList(ROAD_SIDE_LINES_DL)
     
-    # Center lane markings
-    glColor3f(1, 1, 0)
-    for z in range(ROAD_START + 10, ROAD_END - 10, 20):
-        if (z - ROAD_START) % 40 < 20:  # Dashed line
-            glBegin(GL_QUADS)
-            glVertex3f(-0.3, 0.01, z)
-            glVertex3f(0.3, 0.01, z)
-            glVertex3f(0.3, 0.01, z + 15)
-            glVertex3f(-0.3, 0.01, z + 15)
-            glEnd()
+    # Additional boundary markers - small red cubes and floating spheres at regular intervals
+    glCallList(BOUNDARY_MARKERS_DL)
     
-    # Side lines (continuous) - THICKER AND MORE VISIBLE
+    # Additional boundary clarity - draw vertical boundary walls
+    glCallList(BOUNDARY_WALLS_DL)
+    
+    # Bright boundary markers at exact road edges
+    glCallList(ROAD_EDGE_MARKERS_DL)
+    
+    # Road boundary warning stripes (red and white) - helps player see track limits
+    glCallList(WARNING_STRIPES_DL)
+    
+    # Wet road reflection if raining
+    if weather_mode in ["rain", "heavy_rain"]:
+        glEnable(GL_BLEND)
+        glDepthMask(GL_FALSE)
+        glColor4f(0.3, 0.3, 0.4, 0.3 * rain_intensity)
+        
+        glBegin(GL_QUADS)
+        glVertex3f(-ROAD_WIDTH/2, 0.02, ROAD_START)
+        glVertex3f(ROAD_WIDTH/2, 0.02, ROAD_START)
+        glVertex3f(ROAD_WIDTH/2, 0.02, ROAD_END)
+        glVertex3f(-ROAD_WIDTH/2, 0.02, ROAD_END)
+        glEnd()
+        
+        glDepthMask(GL_TRUE)
+
+def draw_spawn_boundary_lines():
+    """Draw the obstacle and powerup spawn boundaries as dashed debug lines (compiled into SPAWN_BOUNDARY_LINES_DL)"""
+    # Obstacle spawn boundary (green line)
+    glColor3f(0.0, 1.0, 0.0)  # Green
+    glLineWidth(2.0)
+    glBegin(GL_LINES)
+    for z in range(int(ROAD_START), int(ROAD_END), 10):
+        # Left boundary
+        glVertex3f(-ROAD_WIDTH/2 + 4.0, 0.02, z)
+        glVertex3f(-ROAD_WIDTH/2 + 4.0, 0.02, z + 5)
+        # Right boundary
+        glVertex3f(ROAD_WIDTH/2 - 4.0, 0.02, z)
+        glVertex3f(ROAD_WIDTH/2 - 4.0, 0.02, z + 5)
+    glEnd()
+    
+    # Powerup spawn boundary (blue line)
+    glColor3f(0.0, 0.0, 1.0)  # Blue
+    glBegin(GL_LINES)
+    for z in range(int(ROAD_START), int(ROAD_END), 10):
+        # Left boundary
+        glVertex3f(-ROAD_WIDTH/2 + 3.0, 0.02, z)
+        glVertex3f(-ROAD_WIDTH/2 + 3.0, 0.02, z + 5)
+        # Right boundary
+        glVertex3f(ROAD_WIDTH/2 - 3.0, 0.02, z)
+        glVertex3f(ROAD_WIDTH/2 - 3.0, 0.02, z + 5)
+    glEnd()
+
+def draw_road_side_lines():
+    """Draw the continuous red lines along both road edges (compiled into ROAD_SIDE_LINES_DL)"""
     glColor3f(1, 0, 0)  # Changed to RED for better visibility
     glLineWidth(5.0)  # Increased from 3.0 to make more visible
     glBegin(GL_LINES)
@@ -1229,7 +1570,9 @@ def draw_road():
     glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_START)
     glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_END)
     glEnd()
-    
+
+def draw_boundary_markers():
+    """Draw the red marker cubes and floating spheres along both road edges (compiled into BOUNDARY_MARKERS_DL)"""
     # Additional boundary markers - small red cubes at regular intervals
     marker_spacing = 20
     for z in range(int(ROAD_START), int(ROAD_END), marker_spacing):
@@ -1260,8 +1603,9 @@ def draw_road():
         glTranslatef(ROAD_WIDTH/2, 2.0, z)
         glutSolidSphere(0.3, 8, 8)
         glPopMatrix()
-    
-    # Additional boundary clarity - draw vertical boundary walls
+
+def draw_boundary_walls():
+    """Draw the semi-transparent red walls along both road edges (compiled into BOUNDARY_WALLS_DL)"""
     glColor4f(1.0, 0.0, 0.0, 0.3)  # Semi-transparent red
     glEnable(GL_BLEND)
     
@@ -1284,8 +1628,9 @@ def draw_road():
     glEnd()
     
     glDisable(GL_BLEND)
-    
-    # Bright boundary markers at exact road edges
+
+def draw_road_edge_markers():
+    """Draw the dashed yellow markers at the exact road edges (compiled into ROAD_EDGE_MARKERS_DL)"""
     glColor3f(1.0, 1.0, 0.0)  # Bright yellow
     glLineWidth(3.0)
     glBegin(GL_LINES)
@@ -1297,278 +1642,327 @@ def draw_road():
         glVertex3f(ROAD_WIDTH/2, 0.05, z)
         glVertex3f(ROAD_WIDTH/2, 0.05, z + 5)
     glEnd()
-    
-    # Road boundary warning stripes (red and white) - helps player see track limits
+
+def draw_warning_stripes():
+    """Draw the red, white and orange boundary warning stripes (compiled into WARNING_STRIPES_DL)"""
     warning_width = 2.0  # Increased from 1.0 to make more visible
     stripe_length = 4.0  # Increased from 3.0 to make more visible
     spacing = 2.0  # Reduced from 3.0 to make stripes closer together
+    stripe_starts = range(int(ROAD_START), int(ROAD_END), int(spacing + stripe_length))
     
-    for z in range(int(ROAD_START), int(ROAD_END), int(spacing + stripe_length)):
+    # Each color is one batch of quads instead of a glBegin/glEnd pair per stripe
+    # Red stripes
+    glColor3f(1.0, 0.0, 0.0)  # Red
+    glBegin(GL_QUADS)
+    for z in stripe_starts:
         # Left boundary warning
-        glColor3f(1.0, 0.0, 0.0)  # Red
-        glBegin(GL_QUADS)
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.02, z)
         glVertex3f(-ROAD_WIDTH/2, 0.02, z)
         glVertex3f(-ROAD_WIDTH/2, 0.02, z + stripe_length)
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.02, z + stripe_length)
-        glEnd()
         
         # Right boundary warning
-        glBegin(GL_QUADS)
         glVertex3f(ROAD_WIDTH/2, 0.02, z)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.02, z)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.02, z + stripe_length)
         glVertex3f(ROAD_WIDTH/2, 0.02, z + stripe_length)
-        glEnd()
-        
-        # White stripes between red ones
-        glColor3f(1.0, 1.0, 1.0)  # White
-        glBegin(GL_QUADS)
+    glEnd()
+    
+    # White stripes between red ones
+    glColor3f(1.0, 1.0, 1.0)  # White
+    glBegin(GL_QUADS)
+    for z in stripe_starts:
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.02, z + stripe_length)
         glVertex3f(-ROAD_WIDTH/2, 0.02, z + stripe_length)
         glVertex3f(-ROAD_WIDTH/2, 0.02, z + stripe_length + spacing)
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.02, z + stripe_length + spacing)
-        glEnd()
         
-        glBegin(GL_QUADS)
         glVertex3f(ROAD_WIDTH/2, 0.02, z + stripe_length)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.02, z + stripe_length)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.02, z + stripe_length + spacing)
         glVertex3f(ROAD_WIDTH/2, 0.02, z + stripe_length + spacing)
-        glEnd()
-        
-        # Add diagonal warning stripes for extra visibility
-        glColor3f(1.0, 0.5, 0.0)  # Orange
-        glBegin(GL_QUADS)
+    glEnd()
+    
+    # Add diagonal warning stripes for extra visibility
+    glColor3f(1.0, 0.5, 0.0)  # Orange
+    glBegin(GL_QUADS)
+    for z in stripe_starts:
         # Left diagonal
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.03, z)
         glVertex3f(-ROAD_WIDTH/2 - warning_width, 0.03, z + stripe_length)
         glVertex3f(-ROAD_WIDTH/2 - warning_width + 0.5, 0.03, z + stripe_length)
         glVertex3f(-ROAD_WIDTH/2 - warning_width + 0.5, 0.03, z)
-        glEnd()
         
         # Right diagonal
-        glBegin(GL_QUADS)
         glVertex3f(ROAD_WIDTH/2 + warning_width - 0.5, 0.03, z)
         glVertex3f(ROAD_WIDTH/2 + warning_width - 0.5, 0.03, z + stripe_length)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.03, z + stripe_length)
         glVertex3f(ROAD_WIDTH/2 + warning_width, 0.03, z)
-        glEnd()
+    glEnd()
+
+def draw_road_markings():
+    """Draw the static road markings (compiled into ROAD_MARKINGS_DL)"""
+    # Draw start line (green)
+    glColor3f(0, 1, 0)
+    glBegin(GL_QUADS)
+    glVertex3f(-ROAD_WIDTH/2, 0.01, ROAD_START)
+    glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_START)
+    glVertex3f(ROAD_WIDTH/2, 0.01, ROAD_START + 2)
+    glVertex3f(-ROAD_WIDTH/2, 0.01, ROAD_START + 2)
+    glEnd()
     
-    # Wet road reflection if raining
-    if weather_mode in ["rain", "heavy_rain"]:
-        glEnable(GL_BLEND)
-        glDepthMask(GL_FALSE)
-        glColor4f(0.3, 0.3, 0.4, 0.3 * rain_intensity)
-        
-        glBegin(GL_QUADS)
-        glVertex3f(-ROAD_WIDTH/2, 0.02, ROAD_START)
-        glVertex3f(ROAD_WIDTH/2, 0.02, ROAD_START)
-        glVertex3f(ROAD_WIDTH/2, 0.02, ROAD_END)
-        glVertex3f(-ROAD_WIDTH/2, 0.02, ROAD_END)
-        glEnd()
-        
-        glDepthMask(GL_TRUE)
+    # Draw finish line (checkered pattern)
+    checker_size = 2
+    glBegin(GL_QUADS)
+    for x in range(int(-ROAD_WIDTH/2), int(ROAD_WIDTH/2), checker_size):
+        for z in range(0, 4, checker_size):
+            if (int(x/checker_size) + int(z/checker_size)) % 2 == 0:
+                glColor3f(1, 1, 1)
+            else:
+                glColor3f(0, 0, 0)
+            glVertex3f(x, 0.01, ROAD_END - 4 + z)
+            glVertex3f(x + checker_size, 0.01, ROAD_END - 4 + z)
+            glVertex3f(x + checker_size, 0.01, ROAD_END - 4 + z + checker_size)
+            glVertex3f(x, 0.01, ROAD_END - 4 + z + checker_size)
+    glEnd()
+    
+    # Center lane markings
+    glColor3f(1, 1, 0)
+    glBegin(GL_QUADS)
+    for z in range(ROAD_START + 10, ROAD_END - 10, 20):
+        if (z - ROAD_START) % 40 < 20:  # Dashed line
+            glVertex3f(-0.3, 0.01, z)
+            glVertex3f(0.3, 0.01, z)
+            glVertex3f(0.3, 0.01, z + 15)
+            glVertex3f(-0.3, 0.01, z + 15)
+    glEnd()
 
 def draw_street_lights():
     """Draw street lights beside the road"""
-    phase = get_time_phase()
-    lights_on = phase in ["Night", "Dusk", "Dawn"] or weather_mode == "heavy_rain"
+    lights_on = time_phase != DAY or weather_mode == "heavy_rain"
     
-    for light in street_lights:
-        z_pos = light['z']
-        
-        # Check if this is a special marker
-        is_special = 'special' in light
-        
-        glPushMatrix()
-        glTranslatef(light['x'], 0, z_pos)
+    # Skip lights the camera can't see
+    lit_lights = []
+    for light in visible_scenery(street_lights):
+        glCallList(light['pole_list'])
         
-        # Light pole
+        # Start/finish markers are always lit
+        if lights_on or 'special' in light:
+            lit_lights.append(light)
+        else:
+            glCallList(light['unlit_list'])
+    
+    # Glowing lamps ignore scene lighting, so they are drawn together in one unlit, blended pass
+    if lit_lights:
+        glDisable(GL_LIGHTING)
+        glEnable(GL_BLEND)
+        for light in lit_lights:
+            glCallList(light['lit_list'])
+        glEnable(GL_LIGHTING)
+
+def draw_street_light_pole(light):
+    """Draw the pole and arm of a street light (compiled into light['pole_list'])"""
+    glPushMatrix()
+    glTranslatef(light['x'], 0, light['z'])
+    
+    # Light pole
+    if 'special' in light:
+        if light['special'] == 'start':
+            glColor3f(0, 0.8, 0)  # Green for start
+        else:
+            glColor3f(0.8, 0, 0)  # Red for finish
+    else:
+        glColor3f(0.3, 0.3, 0.3)
+    
+    glPushMatrix()
+    glRotatef(-90, 1, 0, 0)
+    glutSolidCylinder(0.2, 10, 8, 8)
+    glPopMatrix()
+    
+    # Horizontal arm extending toward road
+    glPushMatrix()
+    glTranslatef(0, 9.5, 0)
+    if light['side'] == 'left':
+        glRotatef(-90, 0, 1, 0)
+    else:
+        glRotatef(90, 0, 1, 0)
+    glRotatef(90, 0, 0, 1)
+    glutSolidCylinder(0.15, 3, 6, 6)
+    glPopMatrix()
+    
+    glPopMatrix()
+
+def draw_street_light_fixture(light, lit):
+    """Draw the lamp of a street light, glowing if lit (compiled into light['lit_list'] / light['unlit_list'])"""
+    # Lit lamps are drawn by draw_street_lights with lighting off and blending on
+    is_special = 'special' in light
+    
+    glPushMatrix()
+    glTranslatef(light['x'], 0, light['z'])
+    
+    # Light fixture
+    light_x = 3 if light['side'] == 'left' else -3
+    
+    if lit:
         if is_special:
             if light['special'] == 'start':
-                glColor3f(0, 0.8, 0)  # Green for start
+                glColor3f(0, 1, 0)  # Green light for start
             else:
-                glColor3f(0.8, 0, 0)  # Red for finish
+                glColor3f(1, 0, 0)  # Red light for finish
         else:
-            glColor3f(0.3, 0.3, 0.3)
+            glColor3f(1.0, 1.0, 0.7)
         
         glPushMatrix()
-        glRotatef(-90, 1, 0, 0)
-        glutSolidCylinder(0.2, 10, 8, 8)
-        glPopMatrix()
-        
-        # Horizontal arm extending toward road
-        glPushMatrix()
-        glTranslatef(0, 9.5, 0)
-        if light['side'] == 'left':
-            glRotatef(-90, 0, 1, 0)
-        else:
-            glRotatef(90, 0, 1, 0)
-        glRotatef(90, 0, 0, 1)
-        glutSolidCylinder(0.15, 3, 6, 6)
+        glTranslatef(light_x, 9.5, 0)
+        glutSolidSphere(0.5, 10, 10)
         glPopMatrix()
         
-        # Light fixture
-        light_x = 3 if light['side'] == 'left' else -3
-        
-        if lights_on or is_special:
-            glDisable(GL_LIGHTING)
-            if is_special:
-                if light['special'] == 'start':
-                    glColor3f(0, 1, 0)  # Green light for start
-                else:
-                    glColor3f(1, 0, 0)  # Red light for finish
-            else:
-                glColor3f(1.0, 1.0, 0.7)
-            
-            glPushMatrix()
-            glTranslatef(light_x, 9.5, 0)
-            glutSolidSphere(0.5, 10, 10)
-            glPopMatrix()
-            
-            # Light glow
-            glEnable(GL_BLEND)
-            if is_special:
-                if light['special'] == 'start':
-                    glColor4f(0, 1, 0, 0.3)
-                else:
-                    glColor4f(1, 0, 0, 0.3)
+        # Light glow
+        if is_special:
+            if light['special'] == 'start':
+                glColor4f(0, 1, 0, 0.3)
             else:
-                glColor4f(1.0, 1.0, 0.5, 0.2)
-            
-            glPushMatrix()
-            glTranslatef(light_x, 9.5, 0)
-            glutSolidSphere(2.5, 8, 8)
-            glPopMatrix()
-            
-            glEnable(GL_LIGHTING)
+                glColor4f(1, 0, 0, 0.3)
         else:
-            glColor3f(0.5, 0.5, 0.5)
-            glPushMatrix()
-            glTranslatef(light_x, 9.5, 0)
-            glutSolidSphere(0.5, 10, 10)
-            glPopMatrix()
+            glColor4f(1.0, 1.0, 0.5, 0.2)
         
+        glPushMatrix()
+        glTranslatef(light_x, 9.5, 0)
+        glutSolidSphere(2.5, 8, 8)
+        glPopMatrix()
+    else:
+        glColor3f(0.5, 0.5, 0.5)
+        glPushMatrix()
+        glTranslatef(light_x, 9.5, 0)
+        glutSolidSphere(0.5, 10, 10)
         glPopMatrix()
+    
+    glPopMatrix()
 
 def draw_buildings():
     """Draw buildings beside the road"""
-    for building in buildings:
-        z_pos = building['z']
-        
-        glPushMatrix()
-        glTranslatef(building['x'], building['height']/2, z_pos)
-        
-        # Main building structure
-        glColor3f(0.6, 0.6, 0.7)
+    # Skip buildings the camera can't see
+    visible_buildings = visible_scenery(buildings)
+    
+    for building in visible_buildings:
+        glCallList(building['body_list'])
+    
+    # Windows at night (window lights are on whenever it isn't full daylight)
+    if time_phase != DAY:
+        glDisable(GL_LIGHTING)
+        for building in visible_buildings:
+            glCallList(building['windows_list'])
+        glEnable(GL_LIGHTING)
+
+def draw_building_body(building):
+    """Draw the main structure of a building (compiled into building['body_list'])"""
+    glPushMatrix()
+    glTranslatef(building['x'], building['height']/2, building['z'])
+    
+    # Main building structure
+    glColor3f(0.6, 0.6, 0.7)
+    glScalef(building['width'], building['height'], building['depth'])
+    glutSolidCube(1)
+    
+    glPopMatrix()
+
+def draw_building_windows(building):
+    """Draw the lit windows of a building (compiled into building['windows_list'])"""
+    glPushMatrix()
+    glTranslatef(building['x'], building['height']/2, building['z'])
+    glColor3f(1.0, 1.0, 0.5)
+    
+    # Front windows facing the road
+    if building['x'] > 0:  # Building on right side
+        window_z = -building['depth']/2 - 0.1
+    else:  # Building on left side
+        window_z = building['depth']/2 + 0.1
+    
+    for window_x, window_y in building['lit_windows']:
         glPushMatrix()
-        glScalef(building['width'], building['height'], building['depth'])
-        glutSolidCube(1)
-        glPopMatrix()
-        
-        # Windows at night
-        phase = get_time_phase()
-        if phase in ["Night", "Dusk", "Dawn"]:
-            glDisable(GL_LIGHTING)
-            glColor3f(1.0, 1.0, 0.5)
-            
-            # Front windows facing the road
-            for floor in range(3, int(building['height']), 5):
-                for window_x in range(-int(building['width']/2) + 2, int(building['width']/2) - 1, 3):
-                    if random.random() > 0.2:
-                        glPushMatrix()
-                        if building['x'] > 0:  # Building on right side
-                            glTranslatef(window_x, floor - building['height']/2, -building['depth']/2 - 0.1)
-                        else:  # Building on left side
-                            glTranslatef(window_x, floor - building['height']/2, building['depth']/2 + 0.1)
-                        glutSolidCube(1.5)
-                        glPopMatrix()
-            
-            glEnable(GL_LIGHTING)
-        
+        glTranslatef(window_x, window_y, window_z)
+        glutSolidCube(1.5)
         glPopMatrix()
+    
+    glPopMatrix()
 
 def draw_trees():
     """Draw trees beside the road"""
-    for tree in trees:
-        z_pos = tree['z']
-        
+    # Skip trees the camera can't see
+    for tree in visible_scenery(trees):
+        glCallList(tree['list'])
+
+def draw_tree_model(tree):
+    """Draw one tree at its position (compiled into tree['list'])"""
+    glPushMatrix()
+    glTranslatef(tree['x'], 0, tree['z'])
+    
+    if tree['type'] == 'pine':
+        # Pine tree trunk
+        glColor3f(0.4, 0.2, 0.1)
         glPushMatrix()
-        glTranslatef(tree['x'], 0, z_pos)
+        glRotatef(-90, 1, 0, 0)
+        glutSolidCylinder(0.8, tree['height']/3, 8, 8)
+        glPopMatrix()
         
-        if tree['type'] == 'pine':
-            # Pine tree trunk
-            glColor3f(0.4, 0.2, 0.1)
+        # Pine tree layers
+        glColor3f(0.1, 0.5, 0.1)
+        for i in range(3):
             glPushMatrix()
+            glTranslatef(0, tree['height']/3 + i*3, 0)
             glRotatef(-90, 1, 0, 0)
-            glutSolidCylinder(0.8, tree['height']/3, 8, 8)
-            glPopMatrix()
-            
-            # Pine tree layers
-            glColor3f(0.1, 0.5, 0.1)
-            for i in range(3):
-                glPushMatrix()
-                glTranslatef(0, tree['height']/3 + i*3, 0)
-                glRotatef(-90, 1, 0, 0)
-                glutSolidCone(4 - i*0.8, 4, 10, 10)
-                glPopMatrix()
-        
-        elif tree['type'] == 'oak':
-            # Oak tree trunk
-            glColor3f(0.3, 0.15, 0.05)
-            glPushMatrix()
-            glRotatef(-90, 1, 0, 0)
-            glutSolidCylinder(1.0, tree['height']/2, 8, 8)
-            glPopMatrix()
-            
-            # Oak tree crown
-            glColor3f(0.2, 0.6, 0.1)
-            glPushMatrix()
-            glTranslatef(0, tree['height']*0.7, 0)
-            glutSolidSphere(tree['height']/2, 12, 12)
+            glutSolidCone(4 - i*0.8, 4, 10, 10)
             glPopMatrix()
+    
+    elif tree['type'] == 'oak':
+        # Oak tree trunk
+        glColor3f(0.3, 0.15, 0.05)
+        glPushMatrix()
+        glRotatef(-90, 1, 0, 0)
+        glutSolidCylinder(1.0, tree['height']/2, 8, 8)
+        glPopMatrix()
         
-        else:  # palm
-            # Palm tree trunk
-            glColor3f(0.5, 0.3, 0.1)
-            for i in range(6):
-                glPushMatrix()
-                glTranslatef(i*0.15, i*2, 0)
-                glRotatef(-90, 1, 0, 0)
-                glutSolidCylinder(0.6, 2, 6, 6)
-                glPopMatrix()
-            
-            # Palm leaves
-            glColor3f(0.1, 0.7, 0.1)
-            for angle in range(0, 360, 45):
-                glPushMatrix()
-                glTranslatef(0.9, tree['height'], 0)
-                glRotatef(angle, 0, 1, 0)
-                glRotatef(30, 1, 0, 0)
-                glScalef(4, 0.4, 1.2)
-                glutSolidCube(1)
-                glPopMatrix()
+        # Oak tree crown
+        glColor3f(0.2, 0.6, 0.1)
+        glPushMatrix()
+        glTranslatef(0, tree['height']*0.7, 0)
+        glutSolidSphere(tree['height']/2, 12, 12)
+        glPopMatrix()
+    
+    else:  # palm
+        # Palm trunk and leaves never change shape, so replay their display lists
+        glCallList(PALM_TRUNK_DL)
         
+        glPushMatrix()
+        glTranslatef(0.9, tree['height'], 0)
+        glCallList(PALM_LEAVES_DL)
         glPopMatrix()
+    
+    glPopMatrix()
 
-def draw_sky():
-    """Draw sky with sun/moon - covers entire visible area, SINGLE COLOR EVERYWHERE."""
-    glDisable(GL_LIGHTING)
-    glDepthMask(GL_FALSE)
-    glDisable(GL_DEPTH_TEST)
-
-    sky_colors = get_sky_colors()
-    # Pick one color for the whole sky (e.g. 'top')
-    solid_color = sky_colors['top']
+def draw_palm_trunk():
+    """Draw the bent palm trunk (compiled into PALM_TRUNK_DL)"""
+    glColor3f(0.5, 0.3, 0.1)
+    for i in range(6):
+        glPushMatrix()
+        glTranslatef(i*0.15, i*2, 0)
+        glRotatef(-90, 1, 0, 0)
+        glutSolidCylinder(0.6, 2, 6, 6)
+        glPopMatrix()
 
-    # Weather adjustment
-    if weather_mode == "heavy_rain":
-        solid_color = [c * 0.5 for c in solid_color]
-    elif weather_mode == "rain":
-        solid_color = [c * 0.7 for c in solid_color]
+def draw_palm_leaves():
+    """Draw the palm leaves around the crown (compiled into PALM_LEAVES_DL)"""
+    glColor3f(0.1, 0.7, 0.1)
+    for angle in range(0, 360, 45):
+        glPushMatrix()
+        glRotatef(angle, 0, 1, 0)
+        glRotatef(30, 1, 0, 0)
+        glScalef(4, 0.4, 1.2)
+        glutSolidCube(1)
+        glPopMatrix()
 
-    glColor3fv(solid_color)
+def draw_sky_box():
+    """Draw the five faces of the sky box in the current color (compiled into SKY_BOX_DL)"""
     # Front face
     glBegin(GL_QUADS)
     glVertex3f(-500, -50, -500)
@@ -1605,173 +1999,149 @@ def draw_sky():
     glVertex3f(-500, 300, 1500)
     glEnd()
 
+def draw_stars():
+    """Draw the fixed star field as white points (compiled into STARS_DL)"""
+    glColor3f(1.0, 1.0, 1.0)
+    glPointSize(2.0)
+    glBegin(GL_POINTS)
+    for star in stars:
+        glVertex3f(*star)
+    glEnd()
+
+def draw_sky():
+    """Draw sky with sun/moon - covers entire visible area, SINGLE COLOR EVERYWHERE."""
+    glDisable(GL_LIGHTING)
+    glDepthMask(GL_FALSE)
+    glDisable(GL_DEPTH_TEST)
+
+    sky_colors = get_sky_colors()
+    # One weather-adjusted color for the whole sky (the palette's 'top'), cached with the other environment colors
+    solid_color = get_environment_colors()[1]
+
+    glColor3fv(solid_color)
+    glCallList(SKY_BOX_DL)
+
     # Sun/Moon
-    sun_angle = time_of_day * 2 * math.pi
-    sun_x = 100 * math.cos(sun_angle)
-    sun_y = 100 * math.sin(sun_angle) + 50
+    sun_x = 100 * sun_cos
+    sun_y = 100 * sun_sin + 50
     sun_z = 0  # Changed from -350 to be more centered
 
     if sun_y > 10:
         glPushMatrix()
         glTranslatef(sun_x, sun_y, sun_z)
-        phase = get_time_phase()
-        if phase == "Night":
+        if time_phase == NIGHT:
             glColor3f(0.9, 0.9, 1.0)
-            glutSolidSphere(5, 16, 16)
+            glCallList(MOON_DL)
             # Add moon glow effect
             glEnable(GL_BLEND)
             glColor4f(0.8, 0.8, 1.0, 0.2)
-            glutSolidSphere(10, 12, 12)
+            glCallList(MOON_GLOW_DL)
         else:
             glColor3fv(sky_colors['sun'])
-            glutSolidSphere(8, 20, 20)
+            glCallList(SUN_DL)
             # Add sun glow effect
             glEnable(GL_BLEND)
             glColor4f(sky_colors['sun'][0], sky_colors['sun'][1], sky_colors['sun'][2], 0.3)
-            glutSolidSphere(15, 16, 16)
+            glCallList(SUN_GLOW_DL)
         glPopMatrix()
 
     # Stars at night
-    phase = get_time_phase()
-    if phase == "Night":
-        glColor3f(1.0, 1.0, 1.0)
-        glPointSize(2.0)
-        glBegin(GL_POINTS)
-        random.seed(42)  # Fixed seed for consistent star positions
-        for i in range(100):
-            star_x = random.uniform(-450, 450)
-            star_y = random.uniform(100, 280)
-            star_z = random.uniform(-450, 1400)
-            glVertex3f(star_x, star_y, star_z)
-        glEnd()
-        random.seed()  # Reset seed
+    if time_phase == NIGHT:
+        glCallList(STARS_DL)
 
     glEnable(GL_DEPTH_TEST)
     glDepthMask(GL_TRUE)
     glEnable(GL_LIGHTING)
 def draw_clouds():
     """Draw clouds"""
+    # Skip clouds the camera can't see, and the whole pass (state changes included)
+    # when none of them are on screen, e.g. while looking down the road at ground level
+    visible_clouds = visible_scenery(clouds)
+    if not visible_clouds:
+        return
+    
     glDisable(GL_LIGHTING)
     glEnable(GL_BLEND)
     glDepthMask(GL_FALSE)
     
-    for cloud in clouds:
+    # Every cloud shares the weather colour, so it is set once for the whole pass
+    glColor4fv(CLOUD_COLORS[weather_mode])
+    
+    for cloud in visible_clouds:
         glPushMatrix()
         glTranslatef(cloud['x'], cloud['y'], cloud['z'])
-        
-        if weather_mode == "heavy_rain":
-            glColor4f(0.3, 0.3, 0.4, 0.9)
-        elif weather_mode == "rain":
-            glColor4f(0.5, 0.5, 0.6, 0.8)
-        else:
-            glColor4f(1, 1, 1, 0.5)
-        
-        for i in range(4):
-            glPushMatrix()
-            glTranslatef(i * cloud['size']/3 - cloud['size']/2, random.uniform(-2, 2), 0)
-            glutSolidSphere(cloud['size']/2, 10, 10)
-            glPopMatrix()
-        
+        glCallList(cloud['list'])
         glPopMatrix()
     
     glDepthMask(GL_TRUE)
     glEnable(GL_LIGHTING)
 
+def draw_cloud_model(cloud):
+    """Draw the puffs of one cloud around its own origin (compiled into cloud['list'])"""
+    for i in range(4):
+        glPushMatrix()
+        glTranslatef(i * cloud['size']/3 - cloud['size']/2, cloud['jitter'][i], 0)
+        glutSolidSphere(cloud['size']/2, 10, 10)
+        glPopMatrix()
+
 def draw_ground():
-    """Draw ground/grass beside the road"""
+    """Draw ground/grass beside the road (compiled into GROUND_DL)"""
     glColor3f(0.3, 0.5, 0.2)
     
-    # Left side ground
+    # All four ground patches go in one batch
     glBegin(GL_QUADS)
+    # Left side ground
     glVertex3f(-400, -0.1, ROAD_START - 100)
     glVertex3f(-(ROAD_WIDTH/2 + 1), -0.1, ROAD_START - 100)
     glVertex3f(-(ROAD_WIDTH/2 + 1), -0.1, ROAD_END + 100)
     glVertex3f(-400, -0.1, ROAD_END + 100)
-    glEnd()
     
-    # Right side ground  
-    glBegin(GL_QUADS)
+    # Right side ground
     glVertex3f((ROAD_WIDTH/2 + 1), -0.1, ROAD_START - 100)
     glVertex3f(400, -0.1, ROAD_START - 100)
     glVertex3f(400, -0.1, ROAD_END + 100)
     glVertex3f((ROAD_WIDTH/2 + 1), -0.1, ROAD_END + 100)
-    glEnd()
     
     # Ground before road start
-    glBegin(GL_QUADS)
     glVertex3f(-400, -0.1, ROAD_START - 100)
     glVertex3f(400, -0.1, ROAD_START - 100)
     glVertex3f(400, -0.1, ROAD_START)
     glVertex3f(-400, -0.1, ROAD_START)
-    glEnd()
     
     # Ground after road end
-    glBegin(GL_QUADS)
     glVertex3f(-400, -0.1, ROAD_END)
     glVertex3f(400, -0.1, ROAD_END)
     glVertex3f(400, -0.1, ROAD_END + 100)
     glVertex3f(-400, -0.1, ROAD_END + 100)
     glEnd()
 
-def draw_road_map():
-    """Draw overhead map view of the straight road with vehicle position"""
-    glDisable(GL_LIGHTING)
-    glDisable(GL_DEPTH_TEST)
-    
+def push_ortho_projection():
+    """Save the 3D matrices and switch to window pixel coordinates for 2D drawing"""
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
-    glLoadIdentity()
-    glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
+    glLoadMatrixf(ORTHO_2D_MATRIX)
     
     glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
-    
-    # Map background
-    map_x = WINDOW_WIDTH - 200
-    map_y = WINDOW_HEIGHT - 200
-    map_width = 60
-    map_height = 180
-    
-    glEnable(GL_BLEND)
-    glColor4f(0, 0, 0, 0.7)
-    glBegin(GL_QUADS)
-    glVertex2f(map_x, map_y)
-    glVertex2f(map_x + map_width, map_y)
-    glVertex2f(map_x + map_width, map_y + map_height)
-    glVertex2f(map_x, map_y + map_height)
-    glEnd()
-    
-    # Map border
-    glColor3f(0.8, 0.8, 0.8)
-    glLineWidth(2.0)
-    glBegin(GL_LINE_LOOP)
-    glVertex2f(map_x, map_y)
-    glVertex2f(map_x + map_width, map_y)
-    glVertex2f(map_x + map_width, map_y + map_height)
-    glVertex2f(map_x, map_y + map_height)
-    glEnd()
-    
-    # Draw straight road on map
-    center_x = map_x + map_width/2
-    glColor3f(0.5, 0.5, 0.5)
-    glLineWidth(8.0)
-    glBegin(GL_LINES)
-    glVertex2f(center_x, map_y + 10)
-    glVertex2f(center_x, map_y + map_height - 10)
-    glEnd()
-    
-    # Draw start and finish markers
-    glColor3f(0, 1, 0)  # Green for start
-    glPointSize(10.0)
-    glBegin(GL_POINTS)
-    glVertex2f(center_x, map_y + map_height - 20)
-    glEnd()
-    
-    glColor3f(1, 0, 0)  # Red for finish
-    glBegin(GL_POINTS)
-    glVertex2f(center_x, map_y + 20)
-    glEnd()
+    glPushMatrix()
+    glLoadIdentity()
+
+def pop_ortho_projection():
+    """Restore the 3D matrices saved by push_ortho_projection"""
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+
+def draw_road_map():
+    """Draw overhead map view of the straight road with vehicle position (inside the 2D overlay set up by display)"""
+    # Static map background, border, road and start/finish markers
+    glCallList(ROAD_MAP_DL)
+    
+    map_x = MAP_X
+    map_y = MAP_Y
+    map_width = MAP_WIDTH
+    map_height = MAP_HEIGHT
+    center_x = map_x + map_width/2
     
     # Draw vehicle position on map (ONLY when game is playing)
     if game_state == "playing":
@@ -1822,86 +2192,79 @@ def draw_road_map():
     
     # Map title
     glColor3f(1, 1, 1)
-    glRasterPos2f(map_x + 5, map_y + map_height - 15)
-    for char in "TRACK MAP":
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-    
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-    
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
+    draw_text(map_x + 5, map_y + map_height - 15, "TRACK MAP", HELVETICA_12_FONT)
 
-def draw_hud():
-    """Draw HUD with environment information"""
-    glDisable(GL_LIGHTING)
-    glDisable(GL_DEPTH_TEST)
+def draw_road_map_background():
+    """Draw the static part of the track map (compiled into ROAD_MAP_DL)"""
+    map_x = MAP_X
+    map_y = MAP_Y
+    map_width = MAP_WIDTH
+    map_height = MAP_HEIGHT
     
-    glMatrixMode(GL_PROJECTION)
-    glPushMatrix()
-    glLoadIdentity()
-    glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
+    # Map background
+    glEnable(GL_BLEND)
+    glColor4f(0, 0, 0, 0.7)
+    glRectf(map_x, map_y, map_x + map_width, map_y + map_height)
     
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
+    # Map border
+    glColor3f(0.8, 0.8, 0.8)
+    glLineWidth(2.0)
+    glBegin(GL_LINE_LOOP)
+    glVertex2f(map_x, map_y)
+    glVertex2f(map_x + map_width, map_y)
+    glVertex2f(map_x + map_width, map_y + map_height)
+    glVertex2f(map_x, map_y + map_height)
+    glEnd()
+    
+    # Draw straight road on map
+    center_x = map_x + map_width/2
+    glColor3f(0.5, 0.5, 0.5)
+    glLineWidth(8.0)
+    glBegin(GL_LINES)
+    glVertex2f(center_x, map_y + 10)
+    glVertex2f(center_x, map_y + map_height - 10)
+    glEnd()
     
+    # Draw start and finish markers in one batch
+    glPointSize(10.0)
+    glBegin(GL_POINTS)
+    glColor3f(0, 1, 0)  # Green for start
+    glVertex2f(center_x, map_y + map_height - 20)
+    glColor3f(1, 0, 0)  # Red for finish
+    glVertex2f(center_x, map_y + 20)
+    glEnd()
+
+def draw_hud():
+    """Draw HUD with environment information (inside the 2D overlay set up by display)"""
     # Info panel
     glEnable(GL_BLEND)
     glColor4f(0, 0, 0, 0.6)
-    glBegin(GL_QUADS)
-    glVertex2f(10, WINDOW_HEIGHT - 100)
-    glVertex2f(300, WINDOW_HEIGHT - 100)
-    glVertex2f(300, WINDOW_HEIGHT - 10)
-    glVertex2f(10, WINDOW_HEIGHT - 10)
-    glEnd()
+    glRectf(10, WINDOW_HEIGHT - 100, 300, WINDOW_HEIGHT - 10)
     
     # Environment info
     glColor3f(1, 1, 1)
     
     # Time
-    time_text = f"Time: {get_time_phase()}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 30)
-    for char in time_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 30, get_hud_text("Time: {}", TIME_PHASE_NAMES[time_phase]), HELVETICA_18_FONT)
     
     # Weather
-    weather_text = f"Weather: {weather_mode.replace('_', ' ').title()}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 55)
-    for char in weather_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 55, get_hud_text("Weather: {}", weather_mode.replace('_', ' ').title()), HELVETICA_18_FONT)
     
     # Auto time
-    auto_text = f"Auto Time: {'ON' if auto_time else 'OFF'}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 80)
-    for char in auto_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 80, get_hud_text("Auto Time: {}", 'ON' if auto_time else 'OFF'), HELVETICA_12_FONT)
     
     # Controls panel
+    glCallList(ENVIRONMENT_CONTROLS_DL)
+
+def draw_environment_controls_panel():
+    """Draw the environment controls panel (compiled into ENVIRONMENT_CONTROLS_DL)"""
     glColor4f(0, 0, 0, 0.5)
-    glBegin(GL_QUADS)
-    glVertex2f(10, 10)
-    glVertex2f(700, 10)
-    glVertex2f(700, 40)
-    glVertex2f(10, 40)
-    glEnd()
+    glRectf(10, 10, 700, 40)
     
     # Controls
     glColor3f(1, 1, 1)
     controls = "1-4: Time (Night/Dawn/Day/Dusk) | R: Weather | T: Auto Time | F: Fog | Arrows: Camera | ESC: Exit"
-    glRasterPos2f(15, 22)
-    for char in controls:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-    
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-    
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
+    draw_text(15, 22, controls, HELVETICA_12_FONT)
 
 def update_environment():
     """Update environment animations for fixed road"""
@@ -1928,7 +2291,7 @@ def update_environment():
     
     # Update game objects
     if game_state == "playing":
-        player_vehicle.update(keys_pressed)
+        player_vehicle.update(keys_pressed, special_keys_pressed)
         check_collisions()
         spawn_objects()
         
@@ -1936,9 +2299,12 @@ def update_environment():
         for obstacle in obstacles:
             obstacle.update()
         
-        # Update powerups
+        # Update powerups - every powerup hovers in phase, so the wave is computed once per frame
+        now = time.time()
+        hover_offset = math.sin(now * 3.0) * 0.3
+        sway_offset = math.sin(now * 2.0) * 0.01
         for powerup in powerups:
-            powerup.update()
+            powerup.update(hover_offset, sway_offset)
         
         # Update speed boost
         global speed_boost_active, speed_boost_timer, speed_boost_stack_count
@@ -2032,7 +2398,7 @@ def draw_shield_effect():
     
     # Draw a single subtle shield layer
     # Use a smaller, more appropriate size for the vehicle
-    glutWireSphere(1.8, 8, 8)  # Much smaller and less detailed
+    glCallList(SHIELD_DL)
     
     glPopMatrix()
     
@@ -2041,6 +2407,24 @@ def draw_shield_effect():
 
 def draw_car():
     """Draw a highly detailed and realistic sports car"""
+    glCallList(CAR_DL)
+
+def draw_bike():
+    """Draw a sleek, modern sport motorcycle"""
+    glCallList(BIKE_DL)
+
+def draw_motorcycle():
+    """Draw a highly detailed and realistic racing bicycle"""
+    camera_dx = player_vehicle.x - current_camera_x
+    camera_dy = player_vehicle.y - current_camera_y
+    camera_dz = player_vehicle.z - current_camera_z
+    if camera_dx * camera_dx + camera_dy * camera_dy + camera_dz * camera_dz < CHAINRING_LOD_DISTANCE * CHAINRING_LOD_DISTANCE:
+        glCallList(MOTORCYCLE_DL)
+    else:
+        glCallList(MOTORCYCLE_LOD_DL)
+
+def draw_car_model():
+    """Draw the sports car geometry (compiled into CAR_DL)"""
     # Main body (lower section) - more aerodynamic
     glColor3f(0.9, 0.1, 0.1)  # Bright red body with metallic sheen
     glPushMatrix()
@@ -2285,8 +2669,8 @@ def draw_car():
     glutSolidCube(1)
     glPopMatrix()
 
-def draw_bike():
-    """Draw a sleek, modern sport motorcycle"""
+def draw_bike_model():
+    """Draw the sport motorcycle geometry (compiled into BIKE_DL)"""
     
     # Main frame - streamlined and aerodynamic
     glColor3f(0.0, 0.0, 0.8)  # Vibrant blue main body
@@ -2583,8 +2967,8 @@ def draw_bike():
     glutSolidCube(1)
     glPopMatrix()
 
-def draw_motorcycle():
-    """Draw a highly detailed and realistic racing bicycle"""
+def draw_motorcycle_model(chainring_teeth=True):
+    """Draw the racing bicycle geometry (compiled into MOTORCYCLE_DL and MOTORCYCLE_LOD_DL)"""
     # Main frame (diamond shape) - more realistic proportions and better wheel alignment
     glColor3f(1.0, 0.7, 0.0)  # Bright gold frame with metallic sheen
     # Top tube - connects head tube to seat tube
@@ -2741,15 +3125,16 @@ def draw_motorcycle():
     glPopMatrix()
     
     # Chainring teeth
-    glColor3f(0.3, 0.3, 0.3)  # Darker
-    for angle in range(0, 360, 20):
-        glPushMatrix()
-        glTranslatef(0, 0.3, -0.9)
-        glRotatef(angle, 0, 1, 0)
-        glTranslatef(0.25, 0, 0)
-        glRotatef(90, 0, 1, 0)
-        glutSolidCylinder(0.02, 0.05, 4, 4)
-        glPopMatrix()
+    if chainring_teeth:
+        glColor3f(0.3, 0.3, 0.3)  # Darker
+        for angle in range(0, 360, 20):
+            glPushMatrix()
+            glTranslatef(0, 0.3, -0.9)
+            glRotatef(angle, 0, 1, 0)
+            glTranslatef(0.25, 0, 0)
+            glRotatef(90, 0, 1, 0)
+            glutSolidCylinder(0.02, 0.05, 4, 4)
+            glPopMatrix()
     
     # Brake system
     glColor3f(0.2, 0.2, 0.2)  # Dark
@@ -2920,311 +3305,247 @@ def draw_motorcycle():
 
 def draw_obstacles():
     """Draw all obstacles"""
+    # All obstacles share one color, so set it once and draw each shape in its own pass
+    glColor3f(0.8, 0.4, 0.2)  # Brown color
+    
     for obstacle in obstacles:
-        if obstacle.collected:
+        if obstacle.collected or obstacle.type != "box":
             continue
         
-
-        
         glPushMatrix()
         glTranslatef(obstacle.x, obstacle.y, obstacle.z)
         glRotatef(obstacle.rotation, 0, 1, 0)
+        glScalef(obstacle.size[0], obstacle.size[1], obstacle.size[2])
+        glCallList(OBSTACLE_BOX_DL)
+        glPopMatrix()
+    
+    for obstacle in obstacles:
+        if obstacle.collected or obstacle.type == "box":
+            continue
         
-        glColor3f(0.8, 0.4, 0.2)  # Brown color
-        
-        if obstacle.type == "box":
-            glScalef(obstacle.size[0], obstacle.size[1], obstacle.size[2])
-            glutSolidCube(1)
-        else:  # cylinder
-            glRotatef(90, 1, 0, 0)
-            glutSolidCylinder(obstacle.size[0]/2, obstacle.size[2], 8, 8)
-        
+        # Cylinder
+        glPushMatrix()
+        glTranslatef(obstacle.x, obstacle.y, obstacle.z)
+        glRotatef(obstacle.rotation, 0, 1, 0)
+        glRotatef(90, 1, 0, 0)
+        # Unit cylinder scaled to this obstacle's radius and height
+        glScalef(obstacle.size[0]/2, obstacle.size[0]/2, obstacle.size[2])
+        glCallList(OBSTACLE_CYLINDER_DL)
         glPopMatrix()
 
 def draw_powerups():
     """Draw all powerups with realistic icons and hovering animations"""
-    for powerup in powerups:
-        if powerup.collected:
-            continue
-        
-
-        
-        glPushMatrix()
-        glTranslatef(powerup.x, powerup.y, powerup.z)
-        glRotatef(powerup.rotation, 0, 1, 0)
-        glScalef(powerup.scale, powerup.scale, powerup.scale)
-        
-        if powerup.type == "speed":
-            # Lightning bolt powerup
-            glColor3f(1.0, 1.0, 0.0)  # Bright yellow
-            
-            # Draw lightning bolt using multiple cubes
-            # Main bolt body
-            glPushMatrix()
-            glTranslatef(0, 0, 0)
-            glRotatef(45, 0, 0, 1)
-            glScalef(0.1, 0.8, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Top branch
-            glPushMatrix()
-            glTranslatef(-0.2, 0.3, 0)
-            glRotatef(-30, 0, 0, 1)
-            glScalef(0.1, 0.4, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Bottom branch
-            glPushMatrix()
-            glTranslatef(0.2, -0.3, 0)
-            glRotatef(30, 0, 0, 1)
-            glScalef(0.1, 0.4, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Add lightning glow effect
-            glEnable(GL_BLEND)
-            glColor4f(1.0, 1.0, 0.0, 0.4)
-            glPushMatrix()
-            glTranslatef(0, 0, 0)
-            glutSolidSphere(0.8, 8, 8)
-            glPopMatrix()
-            glDisable(GL_BLEND)
-            
-        else:  # shield
-            # Shield powerup
-            glColor3f(0.0, 0.8, 1.0)  # Bright blue
-            
-            # Draw shield using curved shape (approximated with cubes)
-            # Main shield body
-            glPushMatrix()
-            glTranslatef(0, 0, 0)
-            glScalef(0.6, 0.8, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Shield top curve
-            glPushMatrix()
-            glTranslatef(0, 0.4, 0)
-            glScalef(0.4, 0.2, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Shield handle
-            glColor3f(0.8, 0.6, 0.2)  # Gold handle
-            glPushMatrix()
-            glTranslatef(0, -0.2, 0)
-            glScalef(0.1, 0.3, 0.1)
-            glutSolidCube(1)
-            glPopMatrix()
-            
-            # Shield cross
-            glColor3f(1.0, 1.0, 1.0)  # White cross
-            glPushMatrix()
-            glTranslatef(0, 0, 0.06)
-            glScalef(0.1, 0.4, 0.02)
-            glutSolidCube(1)
-            glPopMatrix()
+    speed_powerups = [powerup for powerup in powerups if not powerup.collected and powerup.type == "speed"]
+    shield_powerups = [powerup for powerup in powerups if not powerup.collected and powerup.type != "speed"]
+    
+    # Opaque icons first, with the blending left on by the rain and cloud passes turned off
+    glDisable(GL_BLEND)
+    for group, icon_list in ((speed_powerups, SPEED_POWERUP_DL), (shield_powerups, SHIELD_POWERUP_DL)):
+        for powerup in group:
             glPushMatrix()
-            glTranslatef(0, 0, 0.06)
-            glScalef(0.4, 0.1, 0.02)
-            glutSolidCube(1)
+            glTranslatef(powerup.x, powerup.y, powerup.z)
+            glRotatef(powerup.rotation, 0, 1, 0)
+            glScalef(powerup.scale, powerup.scale, powerup.scale)
+            glCallList(icon_list)
             glPopMatrix()
-            
-            # Add shield glow effect
-            glEnable(GL_BLEND)
-            glColor4f(0.0, 0.8, 1.0, 0.3)
+    
+    # Then every glow sphere in a single blended pass over the opaque geometry
+    glEnable(GL_BLEND)
+    
+    for group, glow_color in ((speed_powerups, (1.0, 1.0, 0.0, 0.4)), (shield_powerups, (0.0, 0.8, 1.0, 0.3))):
+        glColor4f(*glow_color)
+        for powerup in group:
             glPushMatrix()
-            glTranslatef(0, 0, 0)
-            glutSolidSphere(0.8, 8, 8)
+            glTranslatef(powerup.x, powerup.y, powerup.z)
+            glRotatef(powerup.rotation, 0, 1, 0)
+            glScalef(powerup.scale, powerup.scale, powerup.scale)
+            glCallList(POWERUP_GLOW_DL)
             glPopMatrix()
-            glDisable(GL_BLEND)
-        
-        glPopMatrix()
+    
+    glDisable(GL_BLEND)
 
-def draw_game_hud():
-    """Draw game-specific HUD elements"""
-    glDisable(GL_LIGHTING)
-    glDisable(GL_DEPTH_TEST)
+def draw_speed_powerup():
+    """Draw the lightning bolt icon of a speed powerup (compiled into SPEED_POWERUP_DL)"""
+    # Lightning bolt powerup
+    glColor3f(1.0, 1.0, 0.0)  # Bright yellow
     
-    glMatrixMode(GL_PROJECTION)
+    # Draw lightning bolt using multiple cubes
+    # Main bolt body
     glPushMatrix()
-    glLoadIdentity()
-    glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
+    glTranslatef(0, 0, 0)
+    glRotatef(45, 0, 0, 1)
+    glScalef(0.1, 0.8, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
     
-    glMatrixMode(GL_MODELVIEW)
+    # Top branch
     glPushMatrix()
-    glLoadIdentity()
+    glTranslatef(-0.2, 0.3, 0)
+    glRotatef(-30, 0, 0, 1)
+    glScalef(0.1, 0.4, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
     
+    # Bottom branch
+    glPushMatrix()
+    glTranslatef(0.2, -0.3, 0)
+    glRotatef(30, 0, 0, 1)
+    glScalef(0.1, 0.4, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
+
+def draw_shield_powerup():
+    """Draw the shield icon of a shield powerup (compiled into SHIELD_POWERUP_DL)"""
+    # Shield powerup
+    glColor3f(0.0, 0.8, 1.0)  # Bright blue
+    
+    # Draw shield using curved shape (approximated with cubes)
+    # Main shield body
+    glPushMatrix()
+    glTranslatef(0, 0, 0)
+    glScalef(0.6, 0.8, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
+    
+    # Shield top curve
+    glPushMatrix()
+    glTranslatef(0, 0.4, 0)
+    glScalef(0.4, 0.2, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
+    
+    # Shield handle
+    glColor3f(0.8, 0.6, 0.2)  # Gold handle
+    glPushMatrix()
+    glTranslatef(0, -0.2, 0)
+    glScalef(0.1, 0.3, 0.1)
+    glutSolidCube(1)
+    glPopMatrix()
+    
+    # Shield cross
+    glColor3f(1.0, 1.0, 1.0)  # White cross
+    glPushMatrix()
+    glTranslatef(0, 0, 0.06)
+    glScalef(0.1, 0.4, 0.02)
+    glutSolidCube(1)
+    glPopMatrix()
+    glPushMatrix()
+    glTranslatef(0, 0, 0.06)
+    glScalef(0.4, 0.1, 0.02)
+    glutSolidCube(1)
+    glPopMatrix()
+
+def draw_game_hud():
+    """Draw game-specific HUD elements (inside the 2D overlay set up by display)"""
     # Game info panel
     glEnable(GL_BLEND)
     glColor4f(0, 0, 0, 0.7)
-    glBegin(GL_QUADS)
-    glVertex2f(10, WINDOW_HEIGHT - 150)
-    glVertex2f(350, WINDOW_HEIGHT - 150)
-    glVertex2f(350, WINDOW_HEIGHT - 10)
-    glVertex2f(10, WINDOW_HEIGHT - 10)
-    glEnd()
+    glRectf(10, WINDOW_HEIGHT - 150, 350, WINDOW_HEIGHT - 10)
     
     # Game info
     glColor3f(1, 1, 1)
     
     # Game state
-    state_text = f"Game: {game_state.upper()}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 30)
-    for char in state_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 30, get_hud_text("Game: {}", game_state.upper()), HELVETICA_18_FONT)
     
     # Lives
-    lives_text = f"Lives: {lives}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 55)
-    for char in lives_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 55, get_hud_text("Lives: {}", lives), HELVETICA_18_FONT)
     
     # Score
-    score_text = f"Score: {score}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 80)
-    for char in score_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 80, get_hud_text("Score: {}", score), HELVETICA_18_FONT)
     
-    # Game time
-    time_text = f"Time: {game_time:.1f}s"
-    glRasterPos2f(20, WINDOW_HEIGHT - 105)
-    for char in time_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    # Game time (rounded so the text is only rebuilt when the shown tenth changes)
+    draw_text(20, WINDOW_HEIGHT - 105, get_hud_text("Time: {:.1f}s", round(game_time, 1)), HELVETICA_18_FONT)
     
     # Camera mode
-    current_mode = camera_modes[camera_mode]
-    camera_text = f"Camera: {current_mode}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 130)
-    for char in camera_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 130, get_hud_text("Camera: {}", camera_modes[camera_mode]), HELVETICA_18_FONT)
     
     # Vehicle type
-    vehicle_text = f"Vehicle: {player_vehicle.type.title()}"
-    glRasterPos2f(20, WINDOW_HEIGHT - 155)
-    for char in vehicle_text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+    draw_text(20, WINDOW_HEIGHT - 155, get_hud_text("Vehicle: {}", player_vehicle.type.title()), HELVETICA_18_FONT)
     
     # Rotation restriction indicator
     if player_vehicle.z > ROAD_START + 5:  # Vehicle has crossed start line
         glColor3f(0.8, 0.6, 0.0)  # Orange color for restriction notice
         restriction_text = "Rotation Restricted: Forward Only"
-        glRasterPos2f(20, WINDOW_HEIGHT - 155)
-        for char in restriction_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+        draw_text(20, WINDOW_HEIGHT - 155, restriction_text, HELVETICA_18_FONT)
     
     # Reset color for other elements
     glColor3f(1, 1, 1)
     
     # Powerup status - Updated for stackable system
     if shield_count > 0:
-        shield_text = f"Shields: {shield_count}"
         glColor3f(0, 1, 1)
-        glRasterPos2f(20, WINDOW_HEIGHT - 155)
-        for char in shield_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+        draw_text(20, WINDOW_HEIGHT - 155, get_hud_text("Shields: {}", shield_count), HELVETICA_18_FONT)
     
     if speed_boost_active:
-        boost_text = f"Speed Boost: {speed_boost_timer:.1f}s (x{speed_boost_stack_count})"
+        boost_text = get_hud_text("Speed Boost: {:.1f}s (x{})", round(speed_boost_timer, 1), speed_boost_stack_count)
         glColor3f(1, 1, 0)
-        glRasterPos2f(200, WINDOW_HEIGHT - 155)
-        for char in boost_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+        draw_text(200, WINDOW_HEIGHT - 155, boost_text, HELVETICA_18_FONT)
     
     # Road boundary warning
     if game_state == "playing":
-        road_left_edge = -ROAD_WIDTH / 2
-        road_right_edge = ROAD_WIDTH / 2
-        distance_to_left = player_vehicle.x - road_left_edge
-        distance_to_right = road_right_edge - player_vehicle.x
+        distance_to_left = player_vehicle.x - ROAD_LEFT_EDGE
+        distance_to_right = ROAD_RIGHT_EDGE - player_vehicle.x
+        edge_distance = min(distance_to_left, distance_to_right)
         
         # Warning when close to edges (within 3 units)
-        if distance_to_left < 3.0 or distance_to_right < 3.0:
-            warning_color = [1.0, 0.0, 0.0] if min(distance_to_left, distance_to_right) < 1.5 else [1.0, 1.0, 0.0]
-            glColor3f(*warning_color)
+        if edge_distance < 3.0:
+            if edge_distance < 1.5:
+                glColor3f(1.0, 0.0, 0.0)
+            else:
+                glColor3f(1.0, 1.0, 0.0)
             
             if distance_to_left < distance_to_right:
-                warning_text = f"LEFT EDGE WARNING: {distance_to_left:.1f}m"
-                glRasterPos2f(350, WINDOW_HEIGHT - 155)
+                warning_text = get_hud_text("LEFT EDGE WARNING: {:.1f}m", round(distance_to_left, 1))
             else:
-                warning_text = f"RIGHT EDGE WARNING: {distance_to_right:.1f}m"
-                glRasterPos2f(350, WINDOW_HEIGHT - 155)
+                warning_text = get_hud_text("RIGHT EDGE WARNING: {:.1f}m", round(distance_to_right, 1))
             
-            for char in warning_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(350, WINDOW_HEIGHT - 155, warning_text, HELVETICA_18_FONT)
         
         # Warning when close to start line (trying to go backwards)
         distance_to_start = player_vehicle.z - (ROAD_START + 5)
         if distance_to_start < 3.0:
-            warning_color = [1.0, 0.0, 0.0] if distance_to_start < 1.5 else [1.0, 1.0, 0.0]
-            glColor3f(*warning_color)
-            warning_text = f"START LINE WARNING: {distance_to_start:.1f}m"
-            glRasterPos2f(350, WINDOW_HEIGHT - 175)
-            for char in warning_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            if distance_to_start < 1.5:
+                glColor3f(1.0, 0.0, 0.0)
+            else:
+                glColor3f(1.0, 1.0, 0.0)
+            warning_text = get_hud_text("START LINE WARNING: {:.1f}m", round(distance_to_start, 1))
+            draw_text(350, WINDOW_HEIGHT - 175, warning_text, HELVETICA_18_FONT)
     
     # Game over screen
     if game_state == "game_over":
         glColor4f(0, 0, 0, 0.8)
-        glBegin(GL_QUADS)
-        glVertex2f(WINDOW_WIDTH/2 - 200, WINDOW_HEIGHT/2 - 100)
-        glVertex2f(WINDOW_WIDTH/2 + 200, WINDOW_HEIGHT/2 - 100)
-        glVertex2f(WINDOW_WIDTH/2 + 200, WINDOW_HEIGHT/2 + 100)
-        glVertex2f(WINDOW_WIDTH/2 - 200, WINDOW_HEIGHT/2 + 100)
-        glEnd()
+        glRectf(WINDOW_WIDTH/2 - 200, WINDOW_HEIGHT/2 - 100, WINDOW_WIDTH/2 + 200, WINDOW_HEIGHT/2 + 100)
         
         glColor3f(1, 1, 1)
         if lives <= 0:
             game_over_text = "GAME OVER"
-            glRasterPos2f(WINDOW_WIDTH/2 - 80, WINDOW_HEIGHT/2 + 20)
-            for char in game_over_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH/2 - 80, WINDOW_HEIGHT/2 + 20, game_over_text, HELVETICA_18_FONT)
             
             restart_text = "Press SPACE to return to menu"
-            glRasterPos2f(WINDOW_WIDTH/2 - 120, WINDOW_HEIGHT/2 - 20)
-            for char in restart_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH/2 - 120, WINDOW_HEIGHT/2 - 20, restart_text, HELVETICA_18_FONT)
         else:
             finish_text = "FINISHED!"
-            glRasterPos2f(WINDOW_WIDTH/2 - 60, WINDOW_HEIGHT/2 + 20)
-            for char in finish_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH/2 - 60, WINDOW_HEIGHT/2 + 20, finish_text, HELVETICA_18_FONT)
             
             restart_text = "Press SPACE to return to menu"
-            glRasterPos2f(WINDOW_WIDTH/2 - 120, WINDOW_HEIGHT/2 - 20)
-            for char in restart_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH/2 - 120, WINDOW_HEIGHT/2 - 20, restart_text, HELVETICA_18_FONT)
     
-    # Controls panel
+    # Controls panel and text never change
+    glCallList(GAME_CONTROLS_DL)
+
+def draw_game_controls_panel():
+    """Draw the game controls panel (compiled into GAME_CONTROLS_DL)"""
     glColor4f(0, 0, 0, 0.5)
-    glBegin(GL_QUADS)
-    glVertex2f(10, 10)
-    glVertex2f(800, 10)
-    glVertex2f(800, 70)
-    glVertex2f(10, 70)
-    glEnd()
+    glRectf(10, 10, 800, 70)
     
     # Controls
     glColor3f(1, 1, 1)
     controls = "W or Up: Forward | S or Down: Brake (slow down) | A/D or Left/Right: Turn | 1-3: Change Vehicle | SPACE: Restart | C: Camera | ESC: Exit"
-    glRasterPos2f(15, 25)
-    for char in controls:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+    draw_text(15, 25, controls, HELVETICA_12_FONT)
     
     vehicle_controls = "Vehicle Types: 1=Cycle (fast turning), 2=Bike (balanced), 3=Car (high speed)"
-    glRasterPos2f(15, 45)
-    for char in vehicle_controls:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-    
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-    
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
+    draw_text(15, 45, vehicle_controls, HELVETICA_12_FONT)
 
 def draw_main_menu():
     """Draw the main menu interface"""
@@ -3238,30 +3559,17 @@ def draw_main_menu():
     glEnable(GL_BLEND)
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     glColor4f(0.0, 0.0, 0.0, 0.7)  # Dark overlay
-    glBegin(GL_QUADS)
-    glVertex2f(-1, -1)
-    glVertex2f(1, -1)
-    glVertex2f(1, 1)
-    glVertex2f(-1, 1)
-    glEnd()
+    glRectf(-1, -1, 1, 1)
     glDisable(GL_BLEND)
     
     # Set up 2D orthographic projection for menu
-    glMatrixMode(GL_PROJECTION)
-    glPushMatrix()
-    glLoadIdentity()
-    glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
+    push_ortho_projection()
     
     if menu_page == "main":
         # Main menu title
         glColor3f(1.0, 1.0, 0.0)  # Yellow title
-        glRasterPos2f(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT - 100)
         title = "🏁 RACING GAME 🏁"
-        for char in title:
-            glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+        draw_text(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT - 100, title, TIMES_ROMAN_24_FONT)
         
         # Menu options
         menu_options = ["Play Game", "Settings", "Instructions", "High Scores", "Exit"]
@@ -3271,50 +3579,37 @@ def draw_main_menu():
             if i == menu_selection:
                 glColor3f(1.0, 0.8, 0.0)  # Bright yellow for selection
                 # Draw selection arrow
-                glRasterPos2f(WINDOW_WIDTH // 2 - 200, start_y - i * 40)
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord('▶'))
+                draw_text(WINDOW_WIDTH // 2 - 200, start_y - i * 40, '▶', HELVETICA_18_FONT)
             else:
                 glColor3f(0.8, 0.8, 0.8)  # Gray for unselected
             
-            glRasterPos2f(WINDOW_WIDTH // 2 - 150, start_y - i * 40)
-            for char in option:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH // 2 - 150, start_y - i * 40, option, HELVETICA_18_FONT)
         
         # Current settings display
         glColor3f(0.6, 0.6, 0.6)
-        glRasterPos2f(50, 100)
         settings_text = f"Vehicle: {selected_vehicle.title()} | Difficulty: {difficulty.title()}"
-        for char in settings_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        draw_text(50, 100, settings_text, HELVETICA_12_FONT)
         
         # Controls hint
         glColor3f(0.5, 0.5, 0.5)
-        glRasterPos2f(50, 50)
         controls_text = "Use ↑↓ to navigate, ENTER to select, ESC to exit"
-        for char in controls_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        draw_text(50, 50, controls_text, HELVETICA_12_FONT)
         
         # Debug info
         glColor3f(0.3, 0.3, 0.3)
-        glRasterPos2f(50, 20)
         debug_text = f"Selection: {menu_selection}, Page: {menu_page}"
-        for char in debug_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_10, ord(char))
+        draw_text(50, 20, debug_text, HELVETICA_10_FONT)
     
     elif menu_page == "settings":
         # Settings page
         glColor3f(1.0, 1.0, 0.0)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 100)
         title = "⚙️ SETTINGS"
-        for char in title:
-            glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+        draw_text(WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 100, title, TIMES_ROMAN_24_FONT)
         
         # Vehicle selection
         glColor3f(0.8, 0.8, 0.8)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2 + 50)
         vehicle_text = "Vehicle Type:"
-        for char in vehicle_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+        draw_text(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2 + 50, vehicle_text, HELVETICA_18_FONT)
         
         vehicles = ["Cycle (Fast turning)", "Bike (Balanced)", "Car (High speed)"]
         vehicle_types = ["cycle", "bike", "car"]
@@ -3322,157 +3617,150 @@ def draw_main_menu():
         for i, (vehicle, vtype) in enumerate(zip(vehicles, vehicle_types)):
             if vtype == selected_vehicle:
                 glColor3f(1.0, 0.8, 0.0)
-                glRasterPos2f(WINDOW_WIDTH // 2 - 180, WINDOW_HEIGHT // 2 - i * 30)
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord('●'))
+                draw_text(WINDOW_WIDTH // 2 - 180, WINDOW_HEIGHT // 2 - i * 30, '●', HELVETICA_18_FONT)
             else:
                 glColor3f(0.6, 0.6, 0.6)
             
-            glRasterPos2f(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - i * 30)
-            for char in vehicle:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
+            draw_text(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - i * 30, vehicle, HELVETICA_18_FONT)
         
         # Navigation instructions
         glColor3f(0.8, 0.8, 0.8)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 100, 150)
         nav_text = "Use ↑↓ to change vehicle, ESC to go back"
-        for char in nav_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        draw_text(WINDOW_WIDTH // 2 - 100, 150, nav_text, HELVETICA_12_FONT)
         
         # Quick selection hint
         glColor3f(0.6, 0.6, 0.6)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 80, 120)
         quick_text = "Or press 1/2/3 for quick selection"
-        for char in quick_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_10, ord(char))
+        draw_text(WINDOW_WIDTH // 2 - 80, 120, quick_text, HELVETICA_10_FONT)
     
     elif menu_page == "instructions":
-        # Instructions page
-        glColor3f(1.0, 1.0, 0.0)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 120, WINDOW_HEIGHT - 100)
-        title = "📖 INSTRUCTIONS"
-        for char in title:
-            glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
-        
-        # Instructions text
-        instructions = [
-            "CONTROLS:",
-            "W/↑: Accelerate",
-            "S/↓: Brake",
-            "A/D or ←/→: Turn",
-            "1/2/3: Change Vehicle",
-            "SPACE: Restart (in game)",
-            "",
-            "CAMERA MODES:",
-            "C: Cycle through camera modes",
-            "V: Quick switch to Chase Cam",
-            "B: Quick switch to Drone Cam",
-            "",
-            "• Chase: Standard following camera",
-            "• Drone: High, wide, strategic view",
-            "• Cinematic: Smooth, movie-like",
-            "• Free: Balanced, versatile view",
-            "",
-            "OBJECTIVES:",
-            "• Reach the finish line",
-            "• Avoid obstacles",
-            "• Collect powerups",
-            "• Don't fall off the road!",
-            "",
-            "POWERUPS:",
-            "• Speed Boost: Increases speed",
-            "• Shield: Protects from collisions"
-        ]
-        
-        start_y = WINDOW_HEIGHT - 150
-        for i, instruction in enumerate(instructions):
-            if instruction.endswith(":"):
-                glColor3f(1.0, 0.8, 0.0)  # Yellow for headers
-            else:
-                glColor3f(0.8, 0.8, 0.8)  # Gray for content
-            
-            glRasterPos2f(100, start_y - i * 25)
-            for char in instruction:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-        
-        # Back option
-        glColor3f(0.8, 0.8, 0.8)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 50, 50)
-        back_text = "Press ESC to go back"
-        for char in back_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        # Instructions page never changes
+        glCallList(INSTRUCTIONS_PAGE_DL)
     
     elif menu_page == "high_scores":
-        # High scores page
-        glColor3f(1.0, 1.0, 0.0)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 120, WINDOW_HEIGHT - 100)
-        title = "🏆 HIGH SCORES 🏆"
-        for char in title:
-            glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
-        
-        # High scores list
-        if not high_scores:
-            glColor3f(0.8, 0.8, 0.8)
-            glRasterPos2f(WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2)
-            no_scores_text = "No high scores yet!"
-            for char in no_scores_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
-            
-            glRasterPos2f(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 40)
-            play_text = "Complete a race to set your first high score!"
-            for char in play_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-        else:
-            # Display top 10 high scores
-            glColor3f(0.8, 0.8, 0.8)
-            glRasterPos2f(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT - 150)
-            header_text = "Rank  Time     Vehicle  Date"
-            for char in header_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-            
-            start_y = WINDOW_HEIGHT - 180
-            for i, (time_val, vehicle, date) in enumerate(high_scores[:10]):
-                # Highlight top 3 scores
-                if i < 3:
-                    if i == 0:
-                        glColor3f(1.0, 0.8, 0.0)  # Gold for 1st
-                    elif i == 1:
-                        glColor3f(0.8, 0.8, 0.8)  # Silver for 2nd
-                    else:
-                        glColor3f(0.8, 0.5, 0.2)  # Bronze for 3rd
-                else:
-                    glColor3f(0.6, 0.6, 0.6)  # Gray for others
-                
-                # Format the score line
-                rank = f"{i+1:2d}."
-                time_str = f"{time_val:6.2f}s"
-                vehicle_str = f"{vehicle:8s}"
-                date_str = date[:10]  # Just the date part
-                
-                score_text = f"{rank}  {time_str}  {vehicle_str}  {date_str}"
-                glRasterPos2f(WINDOW_WIDTH // 2 - 200, start_y - i * 25)
-                for char in score_text:
-                    glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
-        
-        # Back option
-        glColor3f(0.8, 0.8, 0.8)
-        glRasterPos2f(WINDOW_WIDTH // 2 - 50, 50)
-        back_text = "Press ESC to go back"
-        for char in back_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        # High scores page is recompiled only when the scores change
+        glCallList(get_high_scores_page_list())
     
     # Restore 3D projection
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
+    pop_ortho_projection()
     
     # Re-enable depth testing and lighting
     glEnable(GL_DEPTH_TEST)
     glEnable(GL_LIGHTING)
 
+def draw_instructions_page():
+    """Draw the static instructions menu page (compiled into INSTRUCTIONS_PAGE_DL)"""
+    glColor3f(1.0, 1.0, 0.0)
+    title = "📖 INSTRUCTIONS"
+    draw_text(WINDOW_WIDTH // 2 - 120, WINDOW_HEIGHT - 100, title, TIMES_ROMAN_24_FONT)
+    
+    # Instructions text
+    instructions = [
+        "CONTROLS:",
+        "W/↑: Accelerate",
+        "S/↓: Brake",
+        "A/D or ←/→: Turn",
+        "1/2/3: Change Vehicle",
+        "SPACE: Restart (in game)",
+        "",
+        "CAMERA MODES:",
+        "C: Cycle through camera modes",
+        "V: Quick switch to Chase Cam",
+        "B: Quick switch to Drone Cam",
+        "",
+        "• Chase: Standard following camera",
+        "• Drone: High, wide, strategic view",
+        "• Cinematic: Smooth, movie-like",
+        "• Free: Balanced, versatile view",
+        "",
+        "OBJECTIVES:",
+        "• Reach the finish line",
+        "• Avoid obstacles",
+        "• Collect powerups",
+        "• Don't fall off the road!",
+        "",
+        "POWERUPS:",
+        "• Speed Boost: Increases speed",
+        "• Shield: Protects from collisions"
+    ]
+    
+    start_y = WINDOW_HEIGHT - 150
+    for i, instruction in enumerate(instructions):
+        if instruction.endswith(":"):
+            glColor3f(1.0, 0.8, 0.0)  # Yellow for headers
+        else:
+            glColor3f(0.8, 0.8, 0.8)  # Gray for content
+        
+        draw_text(100, start_y - i * 25, instruction, HELVETICA_12_FONT)
+    
+    # Back option
+    glColor3f(0.8, 0.8, 0.8)
+    back_text = "Press ESC to go back"
+    draw_text(WINDOW_WIDTH // 2 - 50, 50, back_text, HELVETICA_12_FONT)
+
+def draw_high_scores_page():
+    """Draw the high scores menu page (compiled into HIGH_SCORES_PAGE_DL)"""
+    glColor3f(1.0, 1.0, 0.0)
+    title = "🏆 HIGH SCORES 🏆"
+    draw_text(WINDOW_WIDTH // 2 - 120, WINDOW_HEIGHT - 100, title, TIMES_ROMAN_24_FONT)
+    
+    # High scores list
+    if not high_scores:
+        glColor3f(0.8, 0.8, 0.8)
+        no_scores_text = "No high scores yet!"
+        draw_text(WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2, no_scores_text, HELVETICA_18_FONT)
+        
+        play_text = "Complete a race to set your first high score!"
+        draw_text(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 40, play_text, HELVETICA_12_FONT)
+    else:
+        # Display top 10 high scores
+        glColor3f(0.8, 0.8, 0.8)
+        header_text = "Rank  Time     Vehicle  Date"
+        draw_text(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT - 150, header_text, HELVETICA_12_FONT)
+        
+        start_y = WINDOW_HEIGHT - 180
+        for i, (time_val, vehicle, date) in enumerate(high_scores[:10]):
+            # Highlight top 3 scores
+            if i < 3:
+                if i == 0:
+                    glColor3f(1.0, 0.8, 0.0)  # Gold for 1st
+                elif i == 1:
+                    glColor3f(0.8, 0.8, 0.8)  # Silver for 2nd
+                else:
+                    glColor3f(0.8, 0.5, 0.2)  # Bronze for 3rd
+            else:
+                glColor3f(0.6, 0.6, 0.6)  # Gray for others
+            
+            # Format the score line
+            rank = f"{i+1:2d}."
+            time_str = f"{time_val:6.2f}s"
+            vehicle_str = f"{vehicle:8s}"
+            date_str = date[:10]  # Just the date part
+            
+            score_text = f"{rank}  {time_str}  {vehicle_str}  {date_str}"
+            draw_text(WINDOW_WIDTH // 2 - 200, start_y - i * 25, score_text, HELVETICA_12_FONT)
+    
+    # Back option
+    glColor3f(0.8, 0.8, 0.8)
+    back_text = "Press ESC to go back"
+    draw_text(WINDOW_WIDTH // 2 - 50, 50, back_text, HELVETICA_12_FONT)
+
+def get_high_scores_page_list():
+    """Return the high scores page display list, recompiling it if the scores changed since it was built"""
+    global HIGH_SCORES_PAGE_DL, high_scores_page_scores
+    
+    if HIGH_SCORES_PAGE_DL == 0 or high_scores_page_scores != high_scores:
+        if HIGH_SCORES_PAGE_DL != 0:
+            glDeleteLists(HIGH_SCORES_PAGE_DL, 1)
+        HIGH_SCORES_PAGE_DL = compile_display_list(draw_high_scores_page)
+        high_scores_page_scores = list(high_scores)
+    
+    return HIGH_SCORES_PAGE_DL
+
 def display():
     """Main display function"""
     # Update clear color based on time
+    update_time_state()
     update_clear_color()
     
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
@@ -3484,7 +3772,7 @@ def display():
     
     # Draw scene in proper order
     draw_sky()
-    draw_ground()
+    glCallList(GROUND_DL)
     draw_road()
     draw_street_lights()
     draw_buildings()
@@ -3501,9 +3789,18 @@ def display():
     if game_state == "main_menu":
         draw_main_menu()
     else:
+        # All HUD panels share one 2D overlay setup
+        glDisable(GL_LIGHTING)
+        glDisable(GL_DEPTH_TEST)
+        push_ortho_projection()
+        
         draw_road_map()
         draw_hud()
         draw_game_hud()
+        
+        pop_ortho_projection()
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
     
     update_environment()
     
@@ -3518,9 +3815,11 @@ def keyboard(key, x, y):
     
     # Handle main menu navigation
     if game_state == "main_menu":
-        print(f"Menu key pressed: {key}, selection: {menu_selection}, page: {menu_page}")  # Debug
+        if DEBUG_MENU:
+            print(f"Menu key pressed: {key}, selection: {menu_selection}, page: {menu_page}")  # Debug
         if key == b'\r' or key == b'\n' or key == b' ':  # Enter key or Space
-            print(f"Enter/Space pressed, selection: {menu_selection}")  # Debug
+            if DEBUG_MENU:
+                print(f"Enter/Space pressed, selection: {menu_selection}")  # Debug
             if menu_page == "main":
                 if menu_selection == 0:  # Play Game
                     game_state = "playing"
@@ -3558,7 +3857,8 @@ def keyboard(key, x, y):
                     print("Entered high scores page")
                 elif menu_selection == 4:  # Exit
                     print("Thanks for playing!")
-                    print("Exiting game...")  # Debug
+                    if DEBUG_MENU:
+                        print("Exiting game...")  # Debug
                     import os
                     os._exit(0)  # Force exit
         elif key == b'\x1b':  # Escape key
@@ -3645,9 +3945,7 @@ def keyboard(key, x, y):
         time_of_day = 0.75
         auto_time = False
     elif key == b'r' or key == b'R':  # Cycle weather
-        modes = ["clear", "rain", "heavy_rain"]
-        idx = modes.index(weather_mode)
-        weather_mode = modes[(idx + 1) % len(modes)]
+        weather_mode = WEATHER_NEXT[weather_mode]
         print(f"Weather: {weather_mode.replace('_', ' ').title()}")
     elif key == b't' or key == b'T':  # Toggle auto time
         auto_time = not auto_time
@@ -3656,7 +3954,7 @@ def keyboard(key, x, y):
         use_fog = not use_fog
         print(f"Fog: {'ON' if use_fog else 'OFF'}")
     elif key == b'c' or key == b'C':  # Cycle camera modes
-        camera_mode = (camera_mode + 1) % len(camera_modes)
+        camera_mode = NEXT_CAMERA_MODE[camera_mode]
         new_mode = camera_modes[camera_mode]
         print(f"Camera Mode: {new_mode}")
         
@@ -3680,14 +3978,13 @@ def keyboard(key, x, y):
             sys.exit(0)
     
     # Store key press for vehicle movement
-    keys_pressed[key] = True
+    keys_pressed[key[0]] = 1
     
 
 
 def keyboard_up(key, x, y):
     """Handle key release"""
-    if key in keys_pressed:
-        del keys_pressed[key]
+    keys_pressed[key[0]] = 0
 
 def special_keys(key, x, y):
     """Handle special keys (from template)"""
@@ -3698,36 +3995,27 @@ def special_keys(key, x, y):
     if game_state == "main_menu":
         if menu_page == "main":
             if key == GLUT_KEY_UP:
-                menu_selection = (menu_selection - 1) % 5
+                menu_selection = (menu_selection - 1) % MAIN_MENU_ITEMS
             elif key == GLUT_KEY_DOWN:
-                menu_selection = (menu_selection + 1) % 5
+                menu_selection = (menu_selection + 1) % MAIN_MENU_ITEMS
         elif menu_page == "settings":
             if key == GLUT_KEY_UP:
                 # Cycle through vehicle types: car -> bike -> cycle -> car
-                if selected_vehicle == "car":
-                    selected_vehicle = "bike"
-                elif selected_vehicle == "bike":
-                    selected_vehicle = "cycle"
-                elif selected_vehicle == "cycle":
-                    selected_vehicle = "car"
+                selected_vehicle = VEHICLE_NEXT[selected_vehicle]
             elif key == GLUT_KEY_DOWN:
                 # Cycle through vehicle types: car -> cycle -> bike -> car
-                if selected_vehicle == "car":
-                    selected_vehicle = "cycle"
-                elif selected_vehicle == "cycle":
-                    selected_vehicle = "bike"
-                elif selected_vehicle == "bike":
-                    selected_vehicle = "car"
+                selected_vehicle = VEHICLE_PREV[selected_vehicle]
         return  # Don't process camera controls when in menu
     
     
     # Store special key press for vehicle movement
-    keys_pressed[key] = True
+    if key < len(special_keys_pressed):
+        special_keys_pressed[key] = 1
 
 def special_keys_up(key, x, y):
     """Handle special key release"""
-    if key in keys_pressed:
-        del keys_pressed[key]
+    if key < len(special_keys_pressed):
+        special_keys_pressed[key] = 0
 
 def timer(value):
     """Timer for consistent frame rate"""